@@ -235,6 +235,10 @@ def render_frame(template, palette, direction, frame_name):
     ``mirror_right_from_left`` to ``True``, the ``"left"`` frame data is
     loaded and horizontally flipped.
 
+    A frame stored as a string (templates with ``"frame_aliases": true``)
+    is an alias for another frame of the same direction, e.g.
+    ``"walk_1": "idle"``.
+
     Parameters
     ----------
     template : dict
@@ -279,6 +283,10 @@ def render_frame(template, palette, direction, frame_name):
         return [TRANSPARENT] * (width * height)
 
     pixel_grid = frames[frame_name]  # list of rows, each row is list of values
+    if isinstance(pixel_grid, str):
+        pixel_grid = frames.get(pixel_grid)
+        if not isinstance(pixel_grid, list):
+            return [TRANSPARENT] * (width * height)
 
     # Build a colour lookup cache so we only resolve once per key.
     colour_cache = {}
@@ -21,7 +21,14 @@ Palette keys used (dot-notation):
 
 import json
 import os
-import copy
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json writes identical bytes
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Shorthand aliases for readability
@@ -42,6 +49,13 @@ EI = "eyes.iris"
 
 SIZE = 48
 
+# Palette ids — frames are stored as uint8 arrays indexing into this tuple
+# (0 = transparent). Keys are only materialized for JSON output, through
+# ID_TO_KEY.
+PALETTE_KEYS = (O, SB, SS, SH, SO, HB, HS, HH, HO, BB, BDS, EW, EI)
+KEY_TO_ID = {key: i for i, key in enumerate(PALETTE_KEYS)}
+ID_TO_KEY = np.array(PALETTE_KEYS, dtype=object)
+
 # Valid palette keys for validation
 VALID_KEYS = {
     0,
@@ -51,42 +65,48 @@ VALID_KEYS = {
     "eyes.white", "eyes.iris",
 }
 
+# Lookup table over every possible byte value: True for valid palette ids
+VALID_MASK = np.zeros(256, dtype=np.bool_)
+VALID_MASK[[KEY_TO_ID[k] for k in VALID_KEYS]] = True
+
 
 # ---------------------------------------------------------------------------
 # Helper: build a 48-wide row from segments
 # ---------------------------------------------------------------------------
-def row(left_pad, *segments):
-    """Build a 48-pixel row.
+def _enc(*keys):
+    """Encode a run of palette keys as a uint8 id array."""
+    return np.fromiter(map(KEY_TO_ID.__getitem__, keys), dtype=np.uint8, count=len(keys))
 
-    Args:
-        left_pad: number of transparent pixels on the left
-        *segments: flat sequence of pixel values
 
-    Returns:
-        list of 48 values, right-padded with 0s
+@lru_cache(maxsize=None)
+def _row(left_pad, segments):
+    """Encode one 48-pixel row of palette ids.
+
+    Rows are interned: identical (left_pad, segments) pairs, e.g. the leg
+    and boot rows repeated across frames, are built once and shared. The
+    returned array is read-only.
     """
-    pixels = [O] * left_pad
-    for seg in segments:
-        if isinstance(seg, list):
-            pixels.extend(seg)
-        else:
-            pixels.append(seg)
-    # Right-pad to 48
-    while len(pixels) < SIZE:
-        pixels.append(O)
-    if len(pixels) > SIZE:
-        raise ValueError(f"Row too wide: {len(pixels)} pixels (max {SIZE})")
+    end = left_pad + len(segments)
+    if end > SIZE:
+        raise ValueError(f"Row too wide: {end} pixels (max {SIZE})")
+    pixels = np.zeros(SIZE, dtype=np.uint8)
+    pixels[left_pad:end] = _enc(*segments)
+    pixels.flags.writeable = False
     return pixels
 
 
-def empty_row():
-    """Fully transparent row."""
-    return [O] * SIZE
+def row(frame, r, left_pad, *segments):
+    """Overwrite row `r` of `frame` in place.
 
+    Args:
+        frame: 48x48 uint8 array of palette ids
+        r: row index to write
+        left_pad: number of transparent pixels on the left
+        *segments: flat sequence of pixel values
 
-def filled(value, count):
-    """Return a list of `count` copies of `value`."""
-    return [value] * count
+    Pixels right of the segments are cleared to transparent.
+    """
+    frame[r] = _row(left_pad, segments)
 
 
 # ---------------------------------------------------------------------------
@@ -99,163 +119,156 @@ def build_down_idle():
     short legs (rows 29-40), chunky feet (rows 41-44).
     Character spans roughly cols 8-40 (~32px wide).
     """
-    f = []
-
-    # Row 0: top padding
-    f.append(empty_row())  # 0
+    # Rows 0 and 45-47 are left as transparent padding
+    f = np.zeros((SIZE, SIZE), dtype=np.uint8)
 
     # --- HEAD rows 1-13 (13 rows total, ~14px wide) ---
     # Head centered around cols 17-30 (14px wide)
 
     # Row 1: top of hair — narrow crest
-    f.append(row(19, HO, HO, HH, HB, HB, HB, HB, HH, HO, HO))  # 1 — hair top
+    row(f, 1, 19, HO, HO, HH, HB, HB, HB, HB, HH, HO, HO)  # 1 — hair top
 
     # Row 2: hair widens
-    f.append(row(17, HO, HS, HB, HH, HB, HB, HB, HB, HH, HB, HS, HO))  # 2 — 12px
+    row(f, 2, 17, HO, HS, HB, HH, HB, HB, HB, HB, HH, HB, HS, HO)  # 2 — 12px
 
     # Row 3: full hair width
-    f.append(row(16, HO, HB, HB, HH, HB, HB, HB, HB, HB, HB, HH, HB, HB, HO))  # 3 — 14px
+    row(f, 3, 16, HO, HB, HB, HH, HB, HB, HB, HB, HB, HB, HH, HB, HB, HO)  # 3 — 14px
 
     # Row 4: hair meeting forehead — transition row
-    f.append(row(16, HO, HS, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HS, HO))  # 4 — 14px
+    row(f, 4, 16, HO, HS, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HS, HO)  # 4 — 14px
 
     # Row 5: forehead — skin visible below hair
-    f.append(row(16, SO, SH, SH, SH, SH, SH, SH, SH, SH, SH, SH, SH, SH, SO))  # 5
+    row(f, 5, 16, SO, SH, SH, SH, SH, SH, SH, SH, SH, SH, SH, SH, SH, SO)  # 5
 
     # Row 6: brow ridge with scar (shadow on one brow)
-    f.append(row(16, SO, SB, SH, SH, SS, SB, SB, SB, SB, SS, SH, SH, SB, SO))  # 6 — brow, scar at col20
+    row(f, 6, 16, SO, SB, SH, SH, SS, SB, SB, SB, SB, SS, SH, SH, SB, SO)  # 6 — brow, scar at col20
 
     # Row 7: eyes row — each eye is 2px (white+iris), separated by 4px nose bridge
     #   14px wide: outline, skin, [W,I], skin, skin, skin, skin, [W,I], skin, skin, outline
-    f.append(row(16, SO, SB, EW, EI, SB, SB, SB, SB, SB, SB, EW, EI, SB, SO))  # 7
+    row(f, 7, 16, SO, SB, EW, EI, SB, SB, SB, SB, SB, SB, EW, EI, SB, SO)  # 7
 
     # Row 8: below eyes / nose — center shadow for nose
-    f.append(row(16, SO, SB, SB, SB, SB, SB, SS, SS, SB, SB, SB, SB, SB, SO))  # 8
+    row(f, 8, 16, SO, SB, SB, SB, SB, SB, SS, SS, SB, SB, SB, SB, SB, SO)  # 8
 
     # Row 9: upper beard area — stubble on cheeks
-    f.append(row(16, SO, SB, SB, BB, BB, SB, SB, SB, SB, BB, BB, SB, SB, SO))  # 9
+    row(f, 9, 16, SO, SB, SB, BB, BB, SB, SB, SB, SB, BB, BB, SB, SB, SO)  # 9
 
     # Row 10: mid beard — fuller in center
-    f.append(row(17, SO, SB, BB, BDS, BB, BB, BB, BB, BDS, BB, SB, SO))  # 10
+    row(f, 10, 17, SO, SB, BB, BDS, BB, BB, BB, BB, BDS, BB, SB, SO)  # 10
 
     # Row 11: lower beard / chin
-    f.append(row(17, SO, SB, BB, BDS, BDS, BB, BB, BDS, BDS, BB, SB, SO))  # 11
+    row(f, 11, 17, SO, SB, BB, BDS, BDS, BB, BB, BDS, BDS, BB, SB, SO)  # 11
 
     # Row 12: jaw narrowing
-    f.append(row(18, SO, SB, SB, BB, BDS, BDS, BDS, BB, SB, SB, SO))  # 12
+    row(f, 12, 18, SO, SB, SB, BB, BDS, BDS, BDS, BB, SB, SB, SO)  # 12
 
     # Row 13: chin bottom — head ends
-    f.append(row(19, SO, SO, SB, SB, SS, SS, SB, SB, SO, SO))  # 13
+    row(f, 13, 19, SO, SO, SB, SB, SS, SS, SB, SB, SO, SO)  # 13
 
     # --- NECK rows 14-15 (short, wide neck) ---
-    f.append(row(20, SO, SB, SS, SB, SB, SS, SB, SO))  # 14 — 8px neck
-    f.append(row(18, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO))  # 15 — neck widens into shoulders
+    row(f, 14, 20, SO, SB, SS, SB, SB, SS, SB, SO)  # 14 — 8px neck
+    row(f, 15, 18, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO)  # 15 — neck widens into shoulders
 
     # --- SHOULDERS & TORSO rows 16-28 ---
     # Shoulders are the widest point: ~22px (cols 13-34)
     # Torso core: ~16px (cols 16-31), arms: 3px each on the sides
 
     # Row 16: shoulder tops — very wide
-    f.append(row(13, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO))  # 16 — 22px
+    row(f, 16, 13, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO)  # 16 — 22px
 
     # Row 17: upper chest + arm start
     # arms: 3px each with 1px gap from torso core
     # Left arm cols 10-12, gap 13, torso 14-33, gap 34, right arm 35-37
-    f.append(row(10, SO, SB, SS, O, SO, SS, SB, SB, SB, SH, SH, SB, SB, SB, SB, SB, SB, SH, SH, SB, SB, SB, SS, SO, O, SS, SB, SO))  # 17 — 28px content
+    row(f, 17, 10, SO, SB, SS, O, SO, SS, SB, SB, SB, SH, SH, SB, SB, SB, SB, SB, SB, SH, SH, SB, SB, SB, SS, SO, O, SS, SB, SO)  # 17 — 28px content
 
     # Row 18: chest — highlights for pecs
-    f.append(row(10, SO, SB, SB, O, SO, SS, SB, SB, SH, SH, SH, SB, SB, SB, SB, SB, SH, SH, SH, SB, SB, SS, SO, O, SB, SB, SO))  # 18
+    row(f, 18, 10, SO, SB, SB, O, SO, SS, SB, SB, SH, SH, SH, SB, SB, SB, SB, SB, SH, SH, SH, SB, SB, SS, SO, O, SB, SB, SO)  # 18
 
     # Row 19: mid-chest
-    f.append(row(10, SO, SS, SB, O, SO, SS, SB, SB, SB, SH, SB, SB, SB, SB, SB, SB, SH, SB, SB, SB, SB, SS, SO, O, SB, SS, SO))  # 19
+    row(f, 19, 10, SO, SS, SB, O, SO, SS, SB, SB, SB, SH, SB, SB, SB, SB, SB, SB, SH, SB, SB, SB, SB, SS, SO, O, SB, SS, SO)  # 19
 
     # Row 20: torso mid
-    f.append(row(10, SO, SB, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SB, SO))  # 20
+    row(f, 20, 10, SO, SB, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SB, SO)  # 20
 
     # Row 21: torso — abs area
-    f.append(row(10, SO, SS, SB, O, SO, SS, SB, SB, SB, SB, SB, SS, SB, SB, SB, SS, SB, SB, SB, SB, SB, SS, SO, O, SB, SS, SO))  # 21
+    row(f, 21, 10, SO, SS, SB, O, SO, SS, SB, SB, SB, SB, SB, SS, SB, SB, SB, SS, SB, SB, SB, SB, SB, SS, SO, O, SB, SS, SO)  # 21
 
     # Row 22: torso narrowing — arms start to end
-    f.append(row(11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO))  # 22
+    row(f, 22, 11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO)  # 22
 
     # Row 23: lower torso
-    f.append(row(11, SO, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SO))  # 23
+    row(f, 23, 11, SO, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SO)  # 23
 
     # Row 24: torso continues
-    f.append(row(11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO))  # 24
+    row(f, 24, 11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO)  # 24
 
     # Row 25: arms ending — hands appear
-    f.append(row(12, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO))  # 25
+    row(f, 25, 12, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO)  # 25
 
     # Row 26: waist — hands at sides
-    f.append(row(11, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB))  # 26
+    row(f, 26, 11, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB)  # 26
 
     # Row 27: hips
-    f.append(row(11, SO, SO, O, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO, O, SO, SO))  # 27
+    row(f, 27, 11, SO, SO, O, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO, O, SO, SO)  # 27
 
     # Row 28: hip bottom — transition to legs
-    f.append(row(15, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO))  # 28
+    row(f, 28, 15, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO)  # 28
 
     # --- LEGS rows 29-40 ---
     # Each leg ~6px wide, 2px gap between, centered
     # Left leg: cols 15-20, gap: 21-22, right leg: 23-28
 
     # Row 29: top of legs — split begins
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 29
+    row(f, 29, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 29
 
     # Row 30: upper legs
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 30
+    row(f, 30, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 30
 
     # Row 31: thigh
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 31
+    row(f, 31, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 31
 
     # Row 32: thigh
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 32
+    row(f, 32, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 32
 
     # Row 33: knee area — slightly wider
-    f.append(row(14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO))  # 33
+    row(f, 33, 14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 33
 
     # Row 34: knee
-    f.append(row(14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO))  # 34
+    row(f, 34, 14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 34
 
     # Row 35: below knee
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 35
+    row(f, 35, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 35
 
     # Row 36: shins
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 36
+    row(f, 36, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 36
 
     # Row 37: lower shins
-    f.append(row(15, SO, SB, SS, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SS, SB, SO))  # 37
+    row(f, 37, 15, SO, SB, SS, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SS, SB, SO)  # 37
 
     # Row 38: shins narrow slightly
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 38
+    row(f, 38, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 38
 
     # Row 39: ankles
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 39
+    row(f, 39, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 39
 
     # Row 40: ankle bottoms
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 40
+    row(f, 40, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 40
 
     # --- FEET rows 41-44 ---
     # Chunky boots: 7px wide each, 2px gap
     # Left foot cols 14-20, gap 21-22, right foot 23-29
 
     # Row 41: boot tops — wider than legs
-    f.append(row(14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO))  # 41
+    row(f, 41, 14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO)  # 41
 
     # Row 42: boot mid
-    f.append(row(14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO))  # 42
+    row(f, 42, 14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO)  # 42
 
     # Row 43: boot soles
-    f.append(row(14, SO, SS, SS, SS, SS, SS, SS, SO, O, O, SO, SS, SS, SS, SS, SS, SS, SO))  # 43
+    row(f, 43, 14, SO, SS, SS, SS, SS, SS, SS, SO, O, O, SO, SS, SS, SS, SS, SS, SS, SO)  # 43
 
     # Row 44: boot bottom outline
-    f.append(row(14, SO, SO, SO, SO, SO, SO, SO, SO, O, O, SO, SO, SO, SO, SO, SO, SO, SO))  # 44
-
-    # Rows 45-47: bottom padding
-    f.append(empty_row())  # 45
-    f.append(empty_row())  # 46
-    f.append(empty_row())  # 47
+    row(f, 44, 14, SO, SO, SO, SO, SO, SO, SO, SO, O, O, SO, SO, SO, SO, SO, SO, SO, SO)  # 44
 
     return f
 
@@ -269,137 +282,130 @@ def build_left_idle():
     Profile is ~15px wide. Head rounder from side (~11px).
     Body thicker, one arm visible in front, legs overlap but chunky.
     """
-    f = []
-
-    # Row 0: top padding
-    f.append(empty_row())  # 0
+    # Rows 0 and 45-47 are left as transparent padding
+    f = np.zeros((SIZE, SIZE), dtype=np.uint8)
 
     # --- HEAD rows 1-13 (~11px wide profile, centered around cols 18-28) ---
 
     # Row 1: top of hair — narrow from side
-    f.append(row(19, HO, HO, HH, HB, HB, HB, HO, HO))  # 1
+    row(f, 1, 19, HO, HO, HH, HB, HB, HB, HO, HO)  # 1
 
     # Row 2: hair fuller
-    f.append(row(18, HO, HB, HH, HB, HB, HB, HB, HB, HO))  # 2 — 9px
+    row(f, 2, 18, HO, HB, HH, HB, HB, HB, HB, HB, HO)  # 2 — 9px
 
     # Row 3: full hair from side — extends back
-    f.append(row(17, HO, HS, HB, HB, HH, HB, HB, HB, HB, HS, HO))  # 3 — 11px
+    row(f, 3, 17, HO, HS, HB, HB, HH, HB, HB, HB, HB, HS, HO)  # 3 — 11px
 
     # Row 4: hair lower
-    f.append(row(17, HO, HB, HB, HB, HB, HB, HB, HB, HB, HB, HO))  # 4
+    row(f, 4, 17, HO, HB, HB, HB, HB, HB, HB, HB, HB, HB, HO)  # 4
 
     # Row 5: forehead in profile — brow ridge
-    f.append(row(17, HO, SH, SH, SH, SS, SB, SB, SB, SB, SB, SO))  # 5
+    row(f, 5, 17, HO, SH, SH, SH, SS, SB, SB, SB, SB, SB, SO)  # 5
 
     # Row 6: eye row — one eye visible, nose protrudes left
-    f.append(row(16, SO, SB, SB, EW, EI, SB, SB, SB, SB, SB, SB, SO))  # 6
+    row(f, 6, 16, SO, SB, SB, EW, EI, SB, SB, SB, SB, SB, SB, SO)  # 6
 
     # Row 7: nose protrudes further
-    f.append(row(15, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 7
+    row(f, 7, 15, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 7
 
     # Row 8: cheek / upper beard
-    f.append(row(16, SO, SB, SB, SB, BB, BB, SB, SB, SB, SB, SB, SO))  # 8
+    row(f, 8, 16, SO, SB, SB, SB, BB, BB, SB, SB, SB, SB, SB, SO)  # 8
 
     # Row 9: beard area
-    f.append(row(16, SO, SB, BB, BDS, BB, BB, SB, SB, SB, SB, SO))  # 9
+    row(f, 9, 16, SO, SB, BB, BDS, BB, BB, SB, SB, SB, SB, SO)  # 9
 
     # Row 10: chin / lower beard
-    f.append(row(17, SO, SB, BB, BDS, BDS, BB, SB, SB, SB, SO))  # 10
+    row(f, 10, 17, SO, SB, BB, BDS, BDS, BB, SB, SB, SB, SO)  # 10
 
     # Row 11: lower jaw
-    f.append(row(18, SO, SB, SB, SS, SB, SB, SB, SB, SO))  # 11
+    row(f, 11, 18, SO, SB, SB, SS, SB, SB, SB, SB, SO)  # 11
 
     # Row 12: jaw bottom
-    f.append(row(19, SO, SB, SB, SB, SB, SB, SB, SO))  # 12
+    row(f, 12, 19, SO, SB, SB, SB, SB, SB, SB, SO)  # 12
 
     # Row 13: chin tip
-    f.append(row(19, SO, SO, SB, SB, SB, SB, SO, SO))  # 13
+    row(f, 13, 19, SO, SO, SB, SB, SB, SB, SO, SO)  # 13
 
     # --- NECK rows 14-15 ---
-    f.append(row(20, SO, SS, SB, SB, SB, SS, SO))  # 14
-    f.append(row(19, SO, SS, SB, SB, SB, SB, SB, SS, SO))  # 15
+    row(f, 14, 20, SO, SS, SB, SB, SB, SS, SO)  # 14
+    row(f, 15, 19, SO, SS, SB, SB, SB, SB, SB, SS, SO)  # 15
 
     # --- SHOULDERS & TORSO rows 16-28 (profile ~15px wide) ---
     # Back arm behind, body, front arm in front
 
     # Row 16: shoulders — wide in profile too
-    f.append(row(15, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO))  # 16 — 15px
+    row(f, 16, 15, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO)  # 16 — 15px
 
     # Row 17: upper chest + arms (back arm behind, front arm in front)
-    f.append(row(13, SO, SB, SO, O, SO, SS, SB, SB, SB, SH, SB, SB, SB, SB, SS, SO, O, SO, SB, SO))  # 17
+    row(f, 17, 13, SO, SB, SO, O, SO, SS, SB, SB, SB, SH, SB, SB, SB, SB, SS, SO, O, SO, SB, SO)  # 17
 
     # Row 18: chest
-    f.append(row(13, SB, SS, SO, O, SO, SS, SB, SB, SH, SH, SB, SB, SB, SB, SS, SO, O, SO, SS, SB))  # 18
+    row(f, 18, 13, SB, SS, SO, O, SO, SS, SB, SB, SH, SH, SB, SB, SB, SB, SS, SO, O, SO, SS, SB)  # 18
 
     # Row 19: mid chest
-    f.append(row(13, SB, SO, SO, O, SO, SS, SB, SB, SB, SH, SB, SB, SB, SB, SS, SO, O, SO, SO, SB))  # 19
+    row(f, 19, 13, SB, SO, SO, O, SO, SS, SB, SB, SB, SH, SB, SB, SB, SB, SS, SO, O, SO, SO, SB)  # 19
 
     # Row 20: torso
-    f.append(row(13, SS, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB, SS))  # 20
+    row(f, 20, 13, SS, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB, SS)  # 20
 
     # Row 21: torso
-    f.append(row(13, SB, SS, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SS, SB))  # 21
+    row(f, 21, 13, SB, SS, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SS, SB)  # 21
 
     # Row 22: torso narrowing
-    f.append(row(14, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB))  # 22
+    row(f, 22, 14, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB)  # 22
 
     # Row 23: lower torso
-    f.append(row(14, SS, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SS))  # 23
+    row(f, 23, 14, SS, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SS)  # 23
 
     # Row 24: lower torso
-    f.append(row(14, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB))  # 24
+    row(f, 24, 14, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB)  # 24
 
     # Row 25: hands + waist
-    f.append(row(15, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO))  # 25
+    row(f, 25, 15, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO)  # 25
 
     # Row 26: waist
-    f.append(row(14, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB))  # 26
+    row(f, 26, 14, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB)  # 26
 
     # Row 27: hips
-    f.append(row(14, SO, SO, O, SO, SO, SS, SB, SB, SB, SB, SB, SB, SS, SO, SO, O, SO, SO))  # 27
+    row(f, 27, 14, SO, SO, O, SO, SO, SS, SB, SB, SB, SB, SB, SB, SS, SO, SO, O, SO, SO)  # 27
 
     # Row 28: hip bottom
-    f.append(row(17, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO))  # 28
+    row(f, 28, 17, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO)  # 28
 
     # --- LEGS rows 29-40 (profile: overlapping, ~9px wide) ---
 
-    f.append(row(17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 29
+    row(f, 29, 17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 29
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO))  # 30
+    row(f, 30, 17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO)  # 30
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO))  # 31
+    row(f, 31, 17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO)  # 31
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO))  # 32
+    row(f, 32, 17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO)  # 32
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SS, SB, SB, SO))  # 33 — knee
+    row(f, 33, 17, SO, SB, SB, SS, SB, SB, SS, SB, SB, SO)  # 33 — knee
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SS, SB, SB, SO))  # 34 — knee
+    row(f, 34, 17, SO, SB, SB, SS, SB, SB, SS, SB, SB, SO)  # 34 — knee
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO))  # 35
+    row(f, 35, 17, SO, SB, SB, SS, SB, SB, SB, SB, SB, SO)  # 35
 
-    f.append(row(17, SO, SB, SS, SS, SB, SB, SB, SB, SB, SO))  # 36
+    row(f, 36, 17, SO, SB, SS, SS, SB, SB, SB, SB, SB, SO)  # 36
 
-    f.append(row(17, SO, SB, SB, SS, SB, SB, SS, SB, SB, SO))  # 37
+    row(f, 37, 17, SO, SB, SB, SS, SB, SB, SS, SB, SB, SO)  # 37
 
-    f.append(row(17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 38
+    row(f, 38, 17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 38
 
-    f.append(row(17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 39
+    row(f, 39, 17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 39
 
-    f.append(row(17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 40
+    row(f, 40, 17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 40
 
     # --- FEET rows 41-44 ---
-    f.append(row(16, SO, SB, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 41
-
-    f.append(row(16, SO, SB, SB, SB, SB, SB, SB, SB, SB, SB, SO))  # 42
+    row(f, 41, 16, SO, SB, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 41
 
-    f.append(row(16, SO, SS, SS, SS, SS, SS, SS, SS, SS, SS, SO))  # 43
+    row(f, 42, 16, SO, SB, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 42
 
-    f.append(row(16, SO, SO, SO, SO, SO, SO, SO, SO, SO, SO, SO))  # 44
+    row(f, 43, 16, SO, SS, SS, SS, SS, SS, SS, SS, SS, SS, SO)  # 43
 
-    # Rows 45-47: bottom padding
-    f.append(empty_row())  # 45
-    f.append(empty_row())  # 46
-    f.append(empty_row())  # 47
+    row(f, 44, 16, SO, SO, SO, SO, SO, SO, SO, SO, SO, SO, SO)  # 44
 
     return f
 
@@ -413,126 +419,135 @@ def build_up_idle():
     Same width as down-facing (~32px). All hair on head (no face features).
     Back of torso visible, broad shoulders.
     """
-    f = []
-
-    # Row 0: top padding
-    f.append(empty_row())  # 0
+    # Rows 0 and 45-47 are left as transparent padding
+    f = np.zeros((SIZE, SIZE), dtype=np.uint8)
 
     # --- HEAD rows 1-13: back of head — all hair ---
 
     # Row 1: top of hair
-    f.append(row(19, HO, HO, HB, HB, HB, HB, HB, HB, HO, HO))  # 1
+    row(f, 1, 19, HO, HO, HB, HB, HB, HB, HB, HB, HO, HO)  # 1
 
     # Row 2: hair widens
-    f.append(row(17, HO, HS, HB, HB, HH, HB, HB, HH, HB, HB, HS, HO))  # 2
+    row(f, 2, 17, HO, HS, HB, HB, HH, HB, HB, HH, HB, HB, HS, HO)  # 2
 
     # Row 3: full hair
-    f.append(row(16, HO, HB, HB, HB, HB, HH, HB, HB, HH, HB, HB, HB, HB, HO))  # 3
+    row(f, 3, 16, HO, HB, HB, HB, HB, HH, HB, HB, HH, HB, HB, HB, HB, HO)  # 3
 
     # Row 4: hair
-    f.append(row(16, HO, HS, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HS, HO))  # 4
+    row(f, 4, 16, HO, HS, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HS, HO)  # 4
 
     # Row 5: hair
-    f.append(row(16, HO, HB, HB, HS, HB, HB, HB, HB, HB, HB, HS, HB, HB, HO))  # 5
+    row(f, 5, 16, HO, HB, HB, HS, HB, HB, HB, HB, HB, HB, HS, HB, HB, HO)  # 5
 
     # Row 6: hair
-    f.append(row(16, HO, HB, HB, HB, HB, HS, HB, HB, HS, HB, HB, HB, HB, HO))  # 6
+    row(f, 6, 16, HO, HB, HB, HB, HB, HS, HB, HB, HS, HB, HB, HB, HB, HO)  # 6
 
     # Row 7: hair
-    f.append(row(16, HO, HB, HS, HB, HB, HB, HB, HB, HB, HB, HB, HS, HB, HO))  # 7
+    row(f, 7, 16, HO, HB, HS, HB, HB, HB, HB, HB, HB, HB, HB, HS, HB, HO)  # 7
 
     # Row 8: hair
-    f.append(row(16, HO, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HO))  # 8
+    row(f, 8, 16, HO, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HB, HO)  # 8
 
     # Row 9: hair
-    f.append(row(16, HO, HB, HB, HS, HB, HB, HB, HB, HB, HB, HS, HB, HB, HO))  # 9
+    row(f, 9, 16, HO, HB, HB, HS, HB, HB, HB, HB, HB, HB, HS, HB, HB, HO)  # 9
 
     # Row 10: hair lower
-    f.append(row(17, HO, HB, HB, HB, HS, HB, HB, HS, HB, HB, HB, HO))  # 10
+    row(f, 10, 17, HO, HB, HB, HB, HS, HB, HB, HS, HB, HB, HB, HO)  # 10
 
     # Row 11: hair bottom
-    f.append(row(18, HO, HB, HB, HB, HB, HB, HB, HB, HB, HB, HO))  # 11
+    row(f, 11, 18, HO, HB, HB, HB, HB, HB, HB, HB, HB, HB, HO)  # 11
 
     # Row 12: hair ends
-    f.append(row(19, HO, HO, HB, HB, HB, HB, HB, HB, HO, HO))  # 12
+    row(f, 12, 19, HO, HO, HB, HB, HB, HB, HB, HB, HO, HO)  # 12
 
     # Row 13: nape of neck visible
-    f.append(row(20, SO, SB, SB, SB, SB, SB, SB, SO))  # 13
+    row(f, 13, 20, SO, SB, SB, SB, SB, SB, SB, SO)  # 13
 
     # --- NECK rows 14-15 ---
-    f.append(row(20, SO, SB, SS, SB, SB, SS, SB, SO))  # 14
-    f.append(row(18, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO))  # 15
+    row(f, 14, 20, SO, SB, SS, SB, SB, SS, SB, SO)  # 14
+    row(f, 15, 18, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO)  # 15
 
     # --- SHOULDERS & TORSO rows 16-28 (same proportions as front, less detail) ---
-    f.append(row(13, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO))  # 16
+    row(f, 16, 13, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO)  # 16
 
     # Arms + torso — flat skin on back, no chest highlights
-    f.append(row(10, SO, SB, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SB, SO))  # 17
+    row(f, 17, 10, SO, SB, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SB, SO)  # 17
 
-    f.append(row(10, SO, SB, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SB, SO))  # 18
+    row(f, 18, 10, SO, SB, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SB, SO)  # 18
 
-    f.append(row(10, SO, SS, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SS, SO))  # 19
+    row(f, 19, 10, SO, SS, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SS, SO)  # 19
 
-    f.append(row(10, SO, SB, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SB, SO))  # 20
+    row(f, 20, 10, SO, SB, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SB, SO)  # 20
 
-    f.append(row(10, SO, SS, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SS, SO))  # 21
+    row(f, 21, 10, SO, SS, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SS, SO)  # 21
 
-    f.append(row(11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO))  # 22
+    row(f, 22, 11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO)  # 22
 
-    f.append(row(11, SO, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SO))  # 23
+    row(f, 23, 11, SO, SS, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SS, SO)  # 23
 
-    f.append(row(11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO))  # 24
+    row(f, 24, 11, SO, SB, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SB, SO)  # 24
 
-    f.append(row(12, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO))  # 25
+    row(f, 25, 12, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO)  # 25
 
-    f.append(row(11, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB))  # 26
+    row(f, 26, 11, SB, SO, O, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, O, SO, SB)  # 26
 
-    f.append(row(11, SO, SO, O, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO, O, SO, SO))  # 27
+    row(f, 27, 11, SO, SO, O, SO, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO, SO, O, SO, SO)  # 27
 
-    f.append(row(15, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO))  # 28
+    row(f, 28, 15, SO, SS, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SB, SS, SO)  # 28
 
     # --- LEGS rows 29-40 (same as down-facing) ---
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 29
+    row(f, 29, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 29
 
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 30
+    row(f, 30, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 30
 
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 31
+    row(f, 31, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 31
 
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 32
+    row(f, 32, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 32
 
-    f.append(row(14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO))  # 33
+    row(f, 33, 14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 33
 
-    f.append(row(14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO))  # 34
+    row(f, 34, 14, SO, SB, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 34
 
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 35
+    row(f, 35, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 35
 
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 36
+    row(f, 36, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 36
 
-    f.append(row(15, SO, SB, SS, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SS, SB, SO))  # 37
+    row(f, 37, 15, SO, SB, SS, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SS, SB, SO)  # 37
 
-    f.append(row(15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO))  # 38
+    row(f, 38, 15, SO, SB, SB, SS, SB, SB, SO, O, O, SO, SB, SB, SS, SB, SB, SO)  # 38
 
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 39
+    row(f, 39, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 39
 
-    f.append(row(15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO))  # 40
+    row(f, 40, 15, SO, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SO)  # 40
 
     # --- FEET rows 41-44 ---
-    f.append(row(14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO))  # 41
+    row(f, 41, 14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO)  # 41
 
-    f.append(row(14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO))  # 42
+    row(f, 42, 14, SO, SB, SB, SB, SB, SB, SB, SO, O, O, SO, SB, SB, SB, SB, SB, SB, SO)  # 42
 
-    f.append(row(14, SO, SS, SS, SS, SS, SS, SS, SO, O, O, SO, SS, SS, SS, SS, SS, SS, SO))  # 43
+    row(f, 43, 14, SO, SS, SS, SS, SS, SS, SS, SO, O, O, SO, SS, SS, SS, SS, SS, SS, SO)  # 43
 
-    f.append(row(14, SO, SO, SO, SO, SO, SO, SO, SO, O, O, SO, SO, SO, SO, SO, SO, SO, SO))  # 44
-
-    # Rows 45-47: bottom padding
-    f.append(empty_row())  # 45
-    f.append(empty_row())  # 46
-    f.append(empty_row())  # 47
+    row(f, 44, 14, SO, SO, SO, SO, SO, SO, SO, SO, O, O, SO, SO, SO, SO, SO, SO, SO, SO)  # 44
 
     return f
 
 
+IDLE_BUILDERS = {"down": build_down_idle, "left": build_left_idle, "up": build_up_idle}
+
+
+@lru_cache(maxsize=None)
+def get_idle(direction):
+    """Return the idle frame for `direction`, built once and then cached.
+
+    The cached array is read-only; callers that need to edit it must copy.
+    Frames are only built when this script runs — the body_metz_48.json
+    it writes is the precomputed artifact everything downstream loads.
+    """
+    frame = IDLE_BUILDERS[direction]()
+    frame.flags.writeable = False
+    return frame
+
+
 # ---------------------------------------------------------------------------
 # Walk frames — derived from idle by modifying legs, arms, and vertical bounce
 # ---------------------------------------------------------------------------
@@ -543,199 +558,236 @@ def bounce_up(frame):
     Row 0 stays empty. Rows 1..46 shift up by 1. Row 47 becomes empty.
     Effectively the character is 1px higher in the frame.
     """
-    f = copy.deepcopy(frame)
-    # Shift everything up by 1 row
-    for i in range(0, SIZE - 1):
-        f[i] = copy.deepcopy(frame[i + 1])
-    f[SIZE - 1] = empty_row()
-    return f
-
-
-def build_walk_1(idle_frame, direction):
+    out = np.empty_like(frame)
+    out[:-1] = frame[1:]
+    out[-1] = O
+    return out
+
+
+# Leg rows that walk frames overwrite on top of the bounced idle frame.
+# Each entry is (row, left_pad, pixels); the rest of the row is cleared.
+# The back view strides exactly like the front view, so "up" shares the
+# "down" tables.
+
+_WALK1_DOWN = [
+    # Legs with stride: left leg forward (extends down-left), right leg back (shorter)
+    # Body shifted up 1, so leg rows are effectively 28-43
+    # Left leg forward, right leg back with wider spread
+    (28, 14, _enc(SO, SB, SB, SB, SB, SB, SO, O, O, O, O, SO, SB, SB, SB, SB, SO)),  # 28
+    (29, 13, _enc(SO, SB, SB, SB, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SB, SB, SO)),  # 29
+    (30, 13, _enc(SO, SB, SB, SS, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SO)),  # 30
+    (31, 13, _enc(SO, SB, SB, SS, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SO)),  # 31
+    (32, 13, _enc(SO, SB, SB, SS, SB, SB, SO, O, O, O, O, O, O, SO, SO)),  # 32
+    (33, 13, _enc(SO, SB, SB, SS, SB, SB, SO)),  # 33
+    (34, 13, _enc(SO, SB, SS, SS, SB, SB, SO)),  # 34
+    (35, 13, _enc(SO, SB, SB, SS, SB, SB, SO)),  # 35
+    (36, 13, _enc(SO, SB, SB, SB, SB, SB, SO)),  # 36
+    (37, 13, _enc(SO, SB, SB, SB, SB, SB, SO)),  # 37
+    (38, 12, _enc(SO, SB, SB, SB, SB, SB, SB, SB, SO)),  # 38 — left foot
+    (39, 12, _enc(SO, SB, SB, SB, SB, SB, SB, SB, SO)),  # 39
+    (40, 12, _enc(SO, SS, SS, SS, SS, SS, SS, SS, SO)),  # 40
+    (41, 12, _enc(SO, SO, SO, SO, SO, SO, SO, SO, SO)),  # 41
+    (42, 0, _enc()),  # 42
+    (43, 0, _enc()),  # 43
+]
+
+_WALK1_LEFT = [
+    # Profile walk: front leg forward, back leg back
+    (28, 17, _enc(SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)),  # 28
+    (29, 16, _enc(SO, SB, SB, SS, SB, SB, O, SB, SB, SB, SO)),  # 29
+    (30, 15, _enc(SO, SB, SB, SS, SB, SO, O, O, SB, SB, SB, SO)),  # 30
+    (31, 14, _enc(SO, SB, SB, SS, SB, SO, O, O, O, SB, SB, SO)),  # 31
+    (32, 14, _enc(SO, SB, SS, SB, SO, O, O, O, O, SO, SB, SO)),  # 32
+    (33, 14, _enc(SO, SB, SB, SB, SO, O, O, O, O, O, SO)),  # 33
+    (34, 13, _enc(SO, SB, SB, SS, SB, SO)),  # 34
+    (35, 13, _enc(SO, SB, SB, SS, SB, SO)),  # 35
+    (36, 13, _enc(SO, SB, SB, SB, SB, SO)),  # 36
+    (37, 13, _enc(SO, SB, SB, SB, SB, SB, SO)),  # 37
+    (38, 12, _enc(SO, SB, SB, SB, SB, SB, SB, SO)),  # 38
+    (39, 12, _enc(SO, SB, SB, SB, SB, SB, SB, SO)),  # 39
+    (40, 12, _enc(SO, SS, SS, SS, SS, SS, SS, SO)),  # 40
+    (41, 12, _enc(SO, SO, SO, SO, SO, SO, SO, SO)),  # 41
+    (42, 0, _enc()),  # 42
+    (43, 0, _enc()),  # 43
+]
+
+
+def mirror_overrides(overrides, keep):
+    """Mirror (row, left_pad, pixels) overrides left-to-right.
+
+    Rows listed in `keep` ({row: (left_pad, pixels)}) are used as given
+    instead of being mirrored.
+    """
+    mirrored = []
+    for r, left_pad, pixels in overrides:
+        if r in keep:
+            mirrored.append((r, *keep[r]))
+        else:
+            mirrored.append((r, SIZE - left_pad - len(pixels), pixels[::-1]))
+    return mirrored
+
+
+# Mirror: right leg forward (extends down-right), left leg back (shorter).
+# The light still falls from the same side, so rows whose shading is not
+# symmetric are drawn explicitly rather than flipped.
+_WALK2_DOWN = mirror_overrides(_WALK1_DOWN, keep={
+    29: (18, _enc(SO, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SB, SB, SB, SB, SB, SO)),
+    30: (18, _enc(SO, SB, SO, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SB, SO)),
+    31: (18, _enc(SO, SB, SO, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SB, SO)),
+    32: (19, _enc(SO, SO, O, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SO)),
+    34: (28, _enc(SO, SB, SS, SS, SB, SB, SO)),
+})
+
+_WALK2_LEFT = [
+    # Profile walk_2: back leg forward, front leg back
+    (28, 17, _enc(SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)),  # 28
+    (29, 17, _enc(SO, SB, SB, SB, SB, O, SB, SB, SS, SB, SO)),  # 29
+    (30, 17, _enc(SO, SB, SB, SB, O, O, SO, SB, SS, SB, SO)),  # 30
+    (31, 17, _enc(SO, SB, SB, O, O, O, SO, SB, SS, SB, SO)),  # 31
+    (32, 18, _enc(SO, SB, SO, O, O, O, O, SO, SS, SB, SO)),  # 32
+    (33, 19, _enc(SO, O, O, O, O, O, SO, SB, SB, SB, SO)),  # 33
+    (34, 27, _enc(SO, SB, SB, SS, SB, SO)),  # 34
+    (35, 27, _enc(SO, SB, SB, SS, SB, SO)),  # 35
+    (36, 27, _enc(SO, SB, SB, SB, SB, SO)),  # 36
+    (37, 27, _enc(SO, SB, SB, SB, SB, SB, SO)),  # 37
+    (38, 26, _enc(SO, SB, SB, SB, SB, SB, SB, SO)),  # 38
+    (39, 26, _enc(SO, SB, SB, SB, SB, SB, SB, SO)),  # 39
+    (40, 26, _enc(SO, SS, SS, SS, SS, SS, SS, SO)),  # 40
+    (41, 26, _enc(SO, SO, SO, SO, SO, SO, SO, SO)),  # 41
+    (42, 0, _enc()),  # 42
+    (43, 0, _enc()),  # 43
+]
+
+WALK1_OVERRIDES = {"down": _WALK1_DOWN, "left": _WALK1_LEFT, "up": _WALK1_DOWN}
+WALK2_OVERRIDES = {"down": _WALK2_DOWN, "left": _WALK2_LEFT, "up": _WALK2_DOWN}
+
+
+def apply_overrides(frame, overrides):
+    """Write (row, left_pad, pixels) overrides into `frame` in place."""
+    for r, left_pad, pixels in overrides:
+        frame[r] = O
+        frame[r, left_pad:left_pad + len(pixels)] = pixels
+
+
+def build_walk_1(direction):
     """Walk frame 1: left leg forward, right leg back.
 
     Body bounces up 1px. Legs spread wider during stride.
     Arm swing is subtle (1px shift).
     """
-    f = bounce_up(idle_frame)
-
-    if direction == "down":
-        # Legs with stride: left leg forward (extends down-left), right leg back (shorter)
-        # Body shifted up 1, so leg rows are effectively 28-43
-        # Left leg forward, right leg back with wider spread
-
-        f[28] = row(14, SO, SB, SB, SB, SB, SB, SO, O, O, O, O, SO, SB, SB, SB, SB, SO)  # 28
-        f[29] = row(13, SO, SB, SB, SB, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SB, SB, SO)  # 29
-        f[30] = row(13, SO, SB, SB, SS, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SO)  # 30
-        f[31] = row(13, SO, SB, SB, SS, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SO)  # 31
-        f[32] = row(13, SO, SB, SB, SS, SB, SB, SO, O, O, O, O, O, O, SO, SO)  # 32
-        f[33] = row(13, SO, SB, SB, SS, SB, SB, SO)  # 33
-        f[34] = row(13, SO, SB, SS, SS, SB, SB, SO)  # 34
-        f[35] = row(13, SO, SB, SB, SS, SB, SB, SO)  # 35
-        f[36] = row(13, SO, SB, SB, SB, SB, SB, SO)  # 36
-        f[37] = row(13, SO, SB, SB, SB, SB, SB, SO)  # 37
-        f[38] = row(12, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 38 — left foot
-        f[39] = row(12, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 39
-        f[40] = row(12, SO, SS, SS, SS, SS, SS, SS, SS, SO)  # 40
-        f[41] = row(12, SO, SO, SO, SO, SO, SO, SO, SO, SO)  # 41
-        f[42] = empty_row()  # 42
-        f[43] = empty_row()  # 43
-
-    elif direction == "left":
-        # Profile walk: front leg forward, back leg back
-        f[28] = row(17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 28
-        f[29] = row(16, SO, SB, SB, SS, SB, SB, O, SB, SB, SB, SO)  # 29
-        f[30] = row(15, SO, SB, SB, SS, SB, SO, O, O, SB, SB, SB, SO)  # 30
-        f[31] = row(14, SO, SB, SB, SS, SB, SO, O, O, O, SB, SB, SO)  # 31
-        f[32] = row(14, SO, SB, SS, SB, SO, O, O, O, O, SO, SB, SO)  # 32
-        f[33] = row(14, SO, SB, SB, SB, SO, O, O, O, O, O, SO)  # 33
-        f[34] = row(13, SO, SB, SB, SS, SB, SO)  # 34
-        f[35] = row(13, SO, SB, SB, SS, SB, SO)  # 35
-        f[36] = row(13, SO, SB, SB, SB, SB, SO)  # 36
-        f[37] = row(13, SO, SB, SB, SB, SB, SB, SO)  # 37
-        f[38] = row(12, SO, SB, SB, SB, SB, SB, SB, SO)  # 38
-        f[39] = row(12, SO, SB, SB, SB, SB, SB, SB, SO)  # 39
-        f[40] = row(12, SO, SS, SS, SS, SS, SS, SS, SO)  # 40
-        f[41] = row(12, SO, SO, SO, SO, SO, SO, SO, SO)  # 41
-        f[42] = empty_row()  # 42
-        f[43] = empty_row()  # 43
-
-    elif direction == "up":
-        # Same as down walk structure but back view
-        f[28] = row(14, SO, SB, SB, SB, SB, SB, SO, O, O, O, O, SO, SB, SB, SB, SB, SO)  # 28
-        f[29] = row(13, SO, SB, SB, SB, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SB, SB, SO)  # 29
-        f[30] = row(13, SO, SB, SB, SS, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SO)  # 30
-        f[31] = row(13, SO, SB, SB, SS, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SO)  # 31
-        f[32] = row(13, SO, SB, SB, SS, SB, SB, SO, O, O, O, O, O, O, SO, SO)  # 32
-        f[33] = row(13, SO, SB, SB, SS, SB, SB, SO)  # 33
-        f[34] = row(13, SO, SB, SS, SS, SB, SB, SO)  # 34
-        f[35] = row(13, SO, SB, SB, SS, SB, SB, SO)  # 35
-        f[36] = row(13, SO, SB, SB, SB, SB, SB, SO)  # 36
-        f[37] = row(13, SO, SB, SB, SB, SB, SB, SO)  # 37
-        f[38] = row(12, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 38
-        f[39] = row(12, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 39
-        f[40] = row(12, SO, SS, SS, SS, SS, SS, SS, SS, SO)  # 40
-        f[41] = row(12, SO, SO, SO, SO, SO, SO, SO, SO, SO)  # 41
-        f[42] = empty_row()  # 42
-        f[43] = empty_row()  # 43
-
+    f = bounce_up(get_idle(direction))
+    apply_overrides(f, WALK1_OVERRIDES[direction])
     return f
 
 
-def build_walk_2(idle_frame, direction):
+def build_walk_2(direction):
     """Walk frame 2: mirror of walk_1 -- right leg forward, left leg back.
 
     Body bounces up 1px. Same stride as walk_1 but mirrored.
     """
-    f = bounce_up(idle_frame)
-
-    if direction == "down":
-        # Mirror: right leg forward (extends down-right), left leg back (shorter)
-        f[28] = row(17, SO, SB, SB, SB, SB, SO, O, O, O, O, SO, SB, SB, SB, SB, SB, SO)  # 28
-        f[29] = row(18, SO, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SB, SB, SB, SB, SB, SO)  # 29
-        f[30] = row(18, SO, SB, SO, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 30
-        f[31] = row(18, SO, SB, SO, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 31
-        f[32] = row(19, SO, SO, O, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SO)  # 32
-        f[33] = row(28, SO, SB, SB, SS, SB, SB, SO)  # 33
-        f[34] = row(28, SO, SB, SS, SS, SB, SB, SO)  # 34
-        f[35] = row(28, SO, SB, SB, SS, SB, SB, SO)  # 35
-        f[36] = row(28, SO, SB, SB, SB, SB, SB, SO)  # 36
-        f[37] = row(28, SO, SB, SB, SB, SB, SB, SO)  # 37
-        f[38] = row(27, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 38 — right foot
-        f[39] = row(27, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 39
-        f[40] = row(27, SO, SS, SS, SS, SS, SS, SS, SS, SO)  # 40
-        f[41] = row(27, SO, SO, SO, SO, SO, SO, SO, SO, SO)  # 41
-        f[42] = empty_row()  # 42
-        f[43] = empty_row()  # 43
-
-    elif direction == "left":
-        # Profile walk_2: back leg forward, front leg back
-        f[28] = row(17, SO, SB, SB, SB, SB, SB, SB, SB, SB, SO)  # 28
-        f[29] = row(17, SO, SB, SB, SB, SB, O, SB, SB, SS, SB, SO)  # 29
-        f[30] = row(17, SO, SB, SB, SB, O, O, SO, SB, SS, SB, SO)  # 30
-        f[31] = row(17, SO, SB, SB, O, O, O, SO, SB, SS, SB, SO)  # 31
-        f[32] = row(18, SO, SB, SO, O, O, O, O, SO, SS, SB, SO)  # 32
-        f[33] = row(19, SO, O, O, O, O, O, SO, SB, SB, SB, SO)  # 33
-        f[34] = row(27, SO, SB, SB, SS, SB, SO)  # 34
-        f[35] = row(27, SO, SB, SB, SS, SB, SO)  # 35
-        f[36] = row(27, SO, SB, SB, SB, SB, SO)  # 36
-        f[37] = row(27, SO, SB, SB, SB, SB, SB, SO)  # 37
-        f[38] = row(26, SO, SB, SB, SB, SB, SB, SB, SO)  # 38
-        f[39] = row(26, SO, SB, SB, SB, SB, SB, SB, SO)  # 39
-        f[40] = row(26, SO, SS, SS, SS, SS, SS, SS, SO)  # 40
-        f[41] = row(26, SO, SO, SO, SO, SO, SO, SO, SO)  # 41
-        f[42] = empty_row()  # 42
-        f[43] = empty_row()  # 43
-
-    elif direction == "up":
-        # Mirror of walk_1 up
-        f[28] = row(17, SO, SB, SB, SB, SB, SO, O, O, O, O, SO, SB, SB, SB, SB, SB, SO)  # 28
-        f[29] = row(18, SO, SB, SB, SB, SO, O, O, O, O, O, SO, SB, SB, SB, SB, SB, SB, SO)  # 29
-        f[30] = row(18, SO, SB, SO, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 30
-        f[31] = row(18, SO, SB, SO, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SB, SO)  # 31
-        f[32] = row(19, SO, SO, O, O, O, O, O, O, SO, SB, SB, SS, SB, SB, SO)  # 32
-        f[33] = row(28, SO, SB, SB, SS, SB, SB, SO)  # 33
-        f[34] = row(28, SO, SB, SS, SS, SB, SB, SO)  # 34
-        f[35] = row(28, SO, SB, SB, SS, SB, SB, SO)  # 35
-        f[36] = row(28, SO, SB, SB, SB, SB, SB, SO)  # 36
-        f[37] = row(28, SO, SB, SB, SB, SB, SB, SO)  # 37
-        f[38] = row(27, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 38
-        f[39] = row(27, SO, SB, SB, SB, SB, SB, SB, SB, SO)  # 39
-        f[40] = row(27, SO, SS, SS, SS, SS, SS, SS, SS, SO)  # 40
-        f[41] = row(27, SO, SO, SO, SO, SO, SO, SO, SO, SO)  # 41
-        f[42] = empty_row()  # 42
-        f[43] = empty_row()  # 43
-
+    f = bounce_up(get_idle(direction))
+    apply_overrides(f, WALK2_OVERRIDES[direction])
     return f
 
 
 # ---------------------------------------------------------------------------
 # Validation
 # ---------------------------------------------------------------------------
-def validate_frame(frame, label):
-    """Validate a frame is 48x48 with only valid pixel values."""
+def validate_frames(frames):
+    """Validate that every frame in {label: frame} is 48x48 with only valid
+    pixel values.
+
+    Frames are stacked and checked against VALID_MASK in a single pass.
+    """
     errors = []
-    if len(frame) != SIZE:
-        errors.append(f"{label}: has {len(frame)} rows, expected {SIZE}")
-    for r_idx, r in enumerate(frame):
-        if len(r) != SIZE:
-            errors.append(f"{label} row {r_idx}: has {len(r)} cols, expected {SIZE}")
-        for c_idx, val in enumerate(r):
-            if val not in VALID_KEYS:
-                errors.append(f"{label} row {r_idx} col {c_idx}: invalid value '{val}'")
+    for label, frame in frames.items():
+        rows, cols = frame.shape
+        if rows != SIZE:
+            errors.append(f"{label}: has {rows} rows, expected {SIZE}")
+        if cols != SIZE:
+            errors.append(f"{label}: has {cols} cols, expected {SIZE}")
+    if errors:
+        return errors  # mis-shaped frames cannot be stacked
+
+    labels = list(frames)
+    stacked = np.stack(list(frames.values()))
+    for f_idx, r_idx, c_idx in np.argwhere(~VALID_MASK[stacked]):
+        errors.append(f"{labels[f_idx]} row {r_idx} col {c_idx}: "
+                      f"invalid value '{stacked[f_idx, r_idx, c_idx]}'")
     return errors
 
 
 # ---------------------------------------------------------------------------
 # ASCII visualization
 # ---------------------------------------------------------------------------
+CHAR_MAP = {
+    0:               ".",
+    "skin.base":     "S",
+    "skin.shadow":   "s",
+    "skin.highlight":"H",
+    "skin.outline":  "#",
+    "hair.base":     "h",
+    "hair.shadow":   "d",
+    "hair.highlight":"L",
+    "hair.outline":  "O",
+    "beard.base":    "b",
+    "beard.shadow":  "B",
+    "eyes.white":    "W",
+    "eyes.iris":     "I",
+}
+CHAR_LUT = np.array([CHAR_MAP[k] for k in PALETTE_KEYS], dtype="U1")
+
+# Column ruler and border lines, shared by every visualization
+HEADER_LINE = "".join(str(i % 10) for i in range(SIZE))
+SEP_LINE = "-" * SIZE
+
+
 def ascii_viz(frame, title=""):
     """Print an ASCII visualization of a frame."""
-    char_map = {
-        0:               ".",
-        "skin.base":     "S",
-        "skin.shadow":   "s",
-        "skin.highlight":"H",
-        "skin.outline":  "#",
-        "hair.base":     "h",
-        "hair.shadow":   "d",
-        "hair.highlight":"L",
-        "hair.outline":  "O",
-        "beard.base":    "b",
-        "beard.shadow":  "B",
-        "eyes.white":    "W",
-        "eyes.iris":     "I",
-    }
+    grid = CHAR_LUT[frame]
 
     print(f"\n{'='*52}")
     print(f"  {title}")
     print(f"{'='*52}")
-    print(f"     {''.join(str(i % 10) for i in range(SIZE))}")
-    print(f"     {''.join('-' for _ in range(SIZE))}")
-    for r_idx, r in enumerate(frame):
-        line = "".join(char_map.get(v, "?") for v in r)
-        print(f"{r_idx:3d} |{line}|")
-    print(f"     {''.join('-' for _ in range(SIZE))}")
+    print(f"     {HEADER_LINE}")
+    print(f"     {SEP_LINE}")
+    for r_idx, chars in enumerate(grid):
+        print(f"{r_idx:3d} |{''.join(chars)}|")
+    print(f"     {SEP_LINE}")
+
+
+# ---------------------------------------------------------------------------
+# JSON output
+# ---------------------------------------------------------------------------
+def write_json(obj, path):
+    """Write `obj` to `path` as JSON with 2-space indentation.
+
+    Uses orjson when it is installed; its OPT_INDENT_2 output is
+    byte-identical to json.dump(indent=2), so templates do not churn.
+    An existing file that already holds exactly these bytes is left
+    untouched (mtime included). Returns True if the file was written.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    try:
+        with open(path, "rb") as fh:
+            if fh.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as fh:
+        fh.write(data)
+    return True
+
+
+def frame_keys(frame):
+    """Convert a palette-id frame back to rows of palette keys.
+
+    A single gather through ID_TO_KEY; 0 stays the integer 0.
+    """
+    return ID_TO_KEY[frame].tolist()
 
 
 # ---------------------------------------------------------------------------
@@ -746,17 +798,17 @@ def main():
     print()
 
     # Build all idle frames
-    down_idle = build_down_idle()
-    left_idle = build_left_idle()
-    up_idle   = build_up_idle()
-
-    # Build walk frames from idle
-    down_walk1 = build_walk_1(down_idle, "down")
-    down_walk2 = build_walk_2(down_idle, "down")
-    left_walk1 = build_walk_1(left_idle, "left")
-    left_walk2 = build_walk_2(left_idle, "left")
-    up_walk1   = build_walk_1(up_idle,   "up")
-    up_walk2   = build_walk_2(up_idle,   "up")
+    down_idle = get_idle("down")
+    left_idle = get_idle("left")
+    up_idle   = get_idle("up")
+
+    # Build walk frames from the cached idle frames
+    down_walk1 = build_walk_1("down")
+    down_walk2 = build_walk_2("down")
+    left_walk1 = build_walk_1("left")
+    left_walk2 = build_walk_2("left")
+    up_walk1   = build_walk_1("up")
+    up_walk2   = build_walk_2("up")
 
     # Validate all frames
     all_frames = {
@@ -771,10 +823,7 @@ def main():
         "up.walk_2":   up_walk2,
     }
 
-    all_errors = []
-    for label, frame in all_frames.items():
-        errors = validate_frame(frame, label)
-        all_errors.extend(errors)
+    all_errors = validate_frames(all_frames)
 
     # ASCII visualization of idle frames
     ascii_viz(down_idle, "DOWN-IDLE (front-facing)")
@@ -788,11 +837,9 @@ def main():
     print(f"  Frames generated: {len(all_frames)}")
     for label in all_frames:
         frame = all_frames[label]
-        rows_ok = len(frame) == SIZE
-        cols_ok = all(len(r) == SIZE for r in frame)
-        status = "OK" if (rows_ok and cols_ok) else "FAIL"
-        pixel_count = sum(1 for r in frame for v in r if v != 0)
-        print(f"    {label:20s}  {status:4s}  ({len(frame)}x{len(frame[0]) if frame else 0})  pixels: {pixel_count}")
+        status = "OK" if frame.shape == (SIZE, SIZE) else "FAIL"
+        pixel_count = np.count_nonzero(frame)
+        print(f"    {label:20s}  {status:4s}  ({frame.shape[0]}x{frame.shape[1]})  pixels: {pixel_count}")
 
     if all_errors:
         print(f"\n  ERRORS ({len(all_errors)}):")
@@ -813,19 +860,19 @@ def main():
         "walk_cycle": ["idle", "walk_1", "idle", "walk_2"],
         "directions": {
             "down": {
-                "idle":   down_idle,
-                "walk_1": down_walk1,
-                "walk_2": down_walk2,
+                "idle":   frame_keys(down_idle),
+                "walk_1": frame_keys(down_walk1),
+                "walk_2": frame_keys(down_walk2),
             },
             "left": {
-                "idle":   left_idle,
-                "walk_1": left_walk1,
-                "walk_2": left_walk2,
+                "idle":   frame_keys(left_idle),
+                "walk_1": frame_keys(left_walk1),
+                "walk_2": frame_keys(left_walk2),
             },
             "up": {
-                "idle":   up_idle,
-                "walk_1": up_walk1,
-                "walk_2": up_walk2,
+                "idle":   frame_keys(up_idle),
+                "walk_1": frame_keys(up_walk1),
+                "walk_2": frame_keys(up_walk2),
             },
         }
     }
@@ -836,8 +883,7 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, "body_metz_48.json")
 
-    with open(output_path, "w") as fh:
-        json.dump(template, fh, indent=2)
+    write_json(template, output_path)
 
     abs_path = os.path.abspath(output_path)
     file_size = os.path.getsize(abs_path)
@@ -25,13 +25,39 @@ Templates generated:
 
 import json
 import os
-import copy
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json writes identical bytes
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 W, H = 48, 48
-EMPTY_ROW = [0] * W
+
+# Palette ids — frames are stored as uint8 arrays indexing into this tuple
+# (0 = transparent). Keys are only materialized for JSON output, through
+# ID_TO_KEY.
+PALETTE_KEYS = (
+    0,
+    "blue_scarf.base", "blue_scarf.shadow", "blue_scarf.highlight",
+    "blue_scarf.outline",
+    "navy_fabric.base", "navy_fabric.shadow", "navy_fabric.outline",
+    "gold_trim.base", "gold_trim.highlight",
+    "steel_armor.base", "steel_armor.shadow", "steel_armor.highlight",
+    "steel_armor.outline",
+    "fur_trim.base", "fur_trim.shadow", "fur_trim.highlight",
+)
+KEY_TO_ID = {key: i for i, key in enumerate(PALETTE_KEYS)}
+ID_TO_KEY = np.array(PALETTE_KEYS, dtype=object)
+
+# Lookup table over every possible byte value: True for ids in PALETTE_KEYS
+VALID_MASK = np.zeros(256, dtype=np.bool_)
+VALID_MASK[:len(PALETTE_KEYS)] = True
 
 BASE_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -43,6 +69,12 @@ ACCESSORIES_DIR = os.path.join(BASE_DIR, "templates", "equipment", "accessories"
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+def _enc(*keys):
+    """Encode palette keys as a uint8 id array."""
+    return np.fromiter(map(KEY_TO_ID.__getitem__, keys), dtype=np.uint8, count=len(keys))
+
+
+@lru_cache(maxsize=None)
 def row(left_pad, *segments):
     """Build a 48-pixel row from a left pad and pixel segments.
 
@@ -50,48 +82,54 @@ def row(left_pad, *segments):
       - an int  -> that many transparent (0) pixels
       - a str   -> one pixel of that palette key
       - a tuple (count, key) -> *count* pixels of *key* (key may be 0)
+
+    Returns a 1-D uint8 array of palette ids; pixels past col 47 are dropped.
+    Rows are interned: identical calls (e.g. the mirrored scarf band rows)
+    are encoded once. The returned array is read-only, so assign it into a
+    frame (which copies) rather than editing it.
     """
-    pixels = [0] * left_pad
+    pixels = np.zeros(W, dtype=np.uint8)
+    i = left_pad
     for seg in segments:
         if isinstance(seg, int):
-            pixels.extend([0] * seg)
+            i += seg
         elif isinstance(seg, str):
-            pixels.append(seg)
+            if i < W:
+                pixels[i] = KEY_TO_ID[seg]
+            i += 1
         elif isinstance(seg, tuple):
             count, key = seg
-            pixels.extend([key] * count)
+            pixels[i:i + count] = KEY_TO_ID[key]
+            i += count
         else:
             raise ValueError(f"Unknown segment type: {type(seg)}")
-    # Pad / truncate to 48
-    if len(pixels) < W:
-        pixels.extend([0] * (W - len(pixels)))
-    elif len(pixels) > W:
-        pixels = pixels[:W]
+    pixels.flags.writeable = False
     return pixels
 
 
 def empty_frame():
-    """Return a 48x48 transparent frame."""
-    return [[0] * W for _ in range(H)]
+    """Return a 48x48 transparent frame (uint8 array of palette ids)."""
+    return np.zeros((H, W), dtype=np.uint8)
 
 
 def validate_frame(frame, label):
-    """Validate a frame is exactly 48 rows x 48 cols, values are 0 or strings."""
+    """Validate a frame is exactly 48 rows x 48 cols of known palette ids.
+
+    The per-pixel checks are a single VALID_MASK lookup over the frame.
+    """
     errors = []
-    if len(frame) != H:
-        errors.append(f"  {label}: expected {H} rows, got {len(frame)}")
-    for r_idx, r in enumerate(frame):
-        if len(r) != W:
-            errors.append(f"  {label} row {r_idx}: expected {W} cols, got {len(r)}")
-        for c_idx, val in enumerate(r):
-            if val != 0 and not isinstance(val, str):
-                errors.append(
-                    f"  {label} row {r_idx} col {c_idx}: invalid value {val!r}"
-                )
-            if isinstance(val, str) and "." not in val:
-                errors.append(
-                    f"  {label} row {r_idx} col {c_idx}: missing dot notation in '{val}'"
-                )
+    if frame.dtype != np.uint8:
+        return [f"  {label}: expected uint8 palette ids, got {frame.dtype}"]
+    rows, cols = frame.shape
+    if rows != H:
+        errors.append(f"  {label}: expected {H} rows, got {rows}")
+    if cols != W:
+        errors.append(f"  {label}: expected {W} cols, got {cols}")
+    for r_idx, c_idx in np.argwhere(~VALID_MASK[frame]):
+        errors.append(
+            f"  {label} row {r_idx} col {c_idx}: "
+            f"invalid value {int(frame[r_idx, c_idx])!r}"
+        )
     return errors
 
 
@@ -105,38 +143,130 @@ def validate_template(tpl):
     return errors
 
 
+def write_json(obj, path):
+    """Write `obj` to `path` as JSON with 2-space indentation.
+
+    Uses orjson when it is installed; its OPT_INDENT_2 output is
+    byte-identical to json.dump(indent=2), so templates do not churn.
+    An existing file that already holds exactly these bytes is left
+    untouched (mtime included). Returns True if the file was written.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def dedup_frames(d_frames):
+    """Convert one direction's frames to JSON-ready values.
+
+    A frame identical to an earlier frame of the same direction is written
+    as that frame's name (e.g. ``"walk_1": "idle"``) instead of a second
+    48x48 grid. Returns (frames, aliased).
+    """
+    out = {}
+    seen = []  # (name, frame) of frames emitted as full grids
+    aliased = False
+    for f_name, frame in d_frames.items():
+        for prev_name, prev in seen:
+            if frame is prev or np.array_equal(frame, prev):
+                out[f_name] = prev_name
+                aliased = True
+                break
+        else:
+            out[f_name] = ID_TO_KEY[frame].tolist()
+            seen.append((f_name, frame))
+    return out, aliased
+
+
 def save_template(tpl, path):
-    """Write template to JSON, creating dirs as needed."""
+    """Write template to JSON, creating dirs as needed.
+
+    Frame arrays are decoded to nested lists of palette keys only here,
+    with a single gather through ID_TO_KEY. Duplicate frames are written
+    as aliases and the template is flagged with ``"frame_aliases": true``
+    so consumers know to resolve them.
+    """
+    out = dict(tpl)
+    out["directions"] = {}
+    any_aliased = False
+    for d_name, d_frames in tpl["directions"].items():
+        out["directions"][d_name], aliased = dedup_frames(d_frames)
+        any_aliased = any_aliased or aliased
+    if any_aliased:
+        out["frame_aliases"] = True
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(tpl, f, indent=2)
-    print(f"  Saved: {path}")
+    if write_json(out, path):
+        print(f"  Saved: {path}")
+    else:
+        print(f"  Unchanged: {path}")
+
+
+def static_walk(frame):
+    """Frames for equipment that does not move during the walk cycle.
+
+    idle, walk_1 and walk_2 share one array, marked read-only so no later
+    edit can leak between them.
+    """
+    frame.flags.writeable = False
+    return {"idle": frame, "walk_1": frame, "walk_2": frame}
+
+
+def bob_walk(idle, bob):
+    """Frames for equipment that takes the same pose on both walk steps.
+
+    walk_1 and walk_2 share the `bob` array, marked read-only like
+    static_walk's frames.
+    """
+    bob.flags.writeable = False
+    return {"idle": idle, "walk_1": bob, "walk_2": bob}
 
 
 def shift_frame_up(frame, px=1):
     """Shift non-empty content up by px rows (bottom rows become empty)."""
-    out = copy.deepcopy(frame)
-    for r in range(H):
-        if r + px < H:
-            out[r] = frame[r + px][:]
-        else:
-            out[r] = [0] * W
+    out = empty_frame()
+    if px < H:
+        out[:H - px] = frame[px:]
     return out
 
 
 def shift_frame_cols(frame, dx):
-    """Shift non-zero content horizontally by dx cols (positive = right)."""
-    out = []
-    for r in frame:
-        new_r = [0] * W
-        for c in range(W):
-            nc = c + dx
-            if 0 <= nc < W and r[c] != 0:
-                new_r[nc] = r[c]
-        out.append(new_r)
+    """Shift content horizontally by dx cols (positive = right).
+
+    Columns shifted past the edge are dropped; vacated columns are
+    transparent.
+    """
+    out = empty_frame()
+    if abs(dx) >= W:
+        return out
+    if dx >= 0:
+        out[:, dx:] = frame[:, :W - dx]
+    else:
+        out[:, :W + dx] = frame[:, -dx:]
     return out
 
 
+def fill_panel(frame, top, bot, lc, rc, outline_key, left_key, base_key, right_key):
+    """Fill rows top..bot, cols lc..rc as an outlined, edge-shaded panel.
+
+    `outline_key` on the edge columns, `left_key` / `right_key` just
+    inside them and `base_key` between.
+    """
+    frame[top:bot + 1, lc + 1:rc] = KEY_TO_ID[base_key]
+    frame[top:bot + 1, lc + 1] = KEY_TO_ID[left_key]
+    frame[top:bot + 1, rc - 1] = KEY_TO_ID[right_key]
+    frame[top:bot + 1, [lc, rc]] = KEY_TO_ID[outline_key]
+
+
 # ===========================================================================
 # TEMPLATE 1: Blue Scarf (Cowl)
 # ===========================================================================
@@ -254,9 +384,9 @@ def make_scarf_blue_cowl():
         "mirror_right_from_left": True,
         "walk_cycle": ["idle", "walk_1", "idle", "walk_2"],
         "directions": {
-            "down": {"idle": down_idle, "walk_1": copy.deepcopy(down_idle), "walk_2": copy.deepcopy(down_idle)},
-            "left": {"idle": left_idle, "walk_1": copy.deepcopy(left_idle), "walk_2": copy.deepcopy(left_idle)},
-            "up":   {"idle": up_idle, "walk_1": copy.deepcopy(up_idle), "walk_2": copy.deepcopy(up_idle)},
+            "down": static_walk(down_idle),
+            "left": static_walk(left_idle),
+            "up":   static_walk(up_idle),
         },
     }
 
@@ -270,63 +400,58 @@ def make_scarf_blue_cowl():
 # LEFT: narrow profile strip ~5px
 # UP: plain back panel (no gold dots)
 # ===========================================================================
+# Lower tabard panel as (top, bottom, left col, right col) slabs: cols 16-31
+# (16px), tapering slightly for the split hem at rows 38-40
+TABARD_SKIRT = (
+    (28, 37, 16, 31),
+    (38, 40, 17, 30),
+)
+
+
+def fill_tabard_panel(frame, top, bot, left_c, right_c):
+    """Fill rows top..bot, cols left_c..right_c with plain navy.
+
+    Outline on the edge columns, shadow just inside them, base between.
+    """
+    fill_panel(frame, top, bot, left_c, right_c, "navy_fabric.outline",
+               "navy_fabric.shadow", "navy_fabric.base", "navy_fabric.shadow")
+
+
+def dot_tabard_panel(frame, top, bot, left_c, right_c):
+    """Scatter gold dots over the panel interior (inside the shadow cols).
+
+    A dot goes wherever (c + r) % 4 == 0: every 4 px, offset by row for
+    a diagonal checkerboard.
+    """
+    rows = np.arange(top, bot + 1)[:, None]
+    cols = np.arange(left_c + 2, right_c - 1)
+    interior = frame[top:bot + 1, left_c + 2:right_c - 1]
+    interior[(rows + cols) % 4 == 0] = KEY_TO_ID["gold_trim.base"]
+
+
 def make_tabard_navy_gold():
-    def lower_tabard_row_down(r_idx, left_col, right_col, split=False):
-        """Generate a row of navy with scattered gold dots."""
-        r = [0] * W
-        for c in range(left_col, right_col + 1):
-            if c == left_col or c == right_col:
-                r[c] = "navy_fabric.outline"
-            elif c == left_col + 1 or c == right_col - 1:
-                r[c] = "navy_fabric.shadow"
-            else:
-                r[c] = "navy_fabric.base"
-            # Gold dots every 3-4 px (offset by row for checkerboard)
-            interior_start = left_col + 2
-            interior_end = right_col - 2
-            if interior_start <= c <= interior_end:
-                if (c + r_idx) % 4 == 0:
-                    r[c] = "gold_trim.base"
-            # Center split at rows 38-40
-            if split and r_idx >= 38:
-                mid = (left_col + right_col) // 2
-                if c == mid:
-                    r[c] = "navy_fabric.shadow"
-        return r
+    # Side peek columns, broadcast down rows 16-28 in the down and up frames
+    left_peek = _enc("navy_fabric.outline", "navy_fabric.shadow", "navy_fabric.base")
+    right_peek = left_peek[::-1]
 
     # -- DOWN idle --
     down_idle = empty_frame()
 
-    # Upper tabard rows 16-28: peeks out at sides of wider chest (3px each side)
+    # Upper tabard rows 16-27: peeks out at sides of wider chest (3px each side)
     # Left side peek: cols 12-14, Right side peek: cols 34-36
-    for r in range(16, 29):
-        down_idle[r] = [0] * W
-        # Left side peek
-        down_idle[r][12] = "navy_fabric.outline"
-        down_idle[r][13] = "navy_fabric.shadow"
-        down_idle[r][14] = "navy_fabric.base"
-        # Right side peek
-        down_idle[r][34] = "navy_fabric.base"
-        down_idle[r][35] = "navy_fabric.shadow"
-        down_idle[r][36] = "navy_fabric.outline"
-
-    # Lower tabard rows 28-40: full front hanging skirt, ~16px wide centered
-    for r_idx in range(28, 41):
-        # Wider skirt: cols 16-31 (16px) tapering slightly at bottom
-        if r_idx <= 34:
-            left_c, right_c = 16, 31
-        elif r_idx <= 37:
-            left_c, right_c = 16, 31
-        else:
-            left_c, right_c = 17, 30
+    down_idle[16:28, 12:15] = left_peek
+    down_idle[16:28, 34:37] = right_peek
 
-        has_split = r_idx >= 38
-        down_idle[r_idx] = lower_tabard_row_down(r_idx, left_c, right_c, split=has_split)
+    # Lower tabard rows 28-40: full front hanging skirt with gold dots
+    for slab in TABARD_SKIRT:
+        fill_tabard_panel(down_idle, *slab)
+        dot_tabard_panel(down_idle, *slab)
+    # Center split at rows 38-40
+    down_idle[38:41, (17 + 30) // 2] = KEY_TO_ID["navy_fabric.shadow"]
 
     # Bottom edge: outline
-    down_idle[40] = [0] * W
-    for c in range(17, 31):
-        down_idle[40][c] = "navy_fabric.outline"
+    down_idle[40] = 0
+    down_idle[40, 17:31] = KEY_TO_ID["navy_fabric.outline"]
 
     # -- DOWN walk_1: sway 1px left --
     down_walk1 = shift_frame_cols(down_idle, -1)
@@ -335,24 +460,19 @@ def make_tabard_navy_gold():
 
     # -- LEFT idle: narrow side drape 5px (cols 19-23) --
     left_idle = empty_frame()
-    for r_idx in range(16, 29):
-        left_idle[r_idx][19] = "navy_fabric.outline"
-        left_idle[r_idx][20] = "navy_fabric.shadow"
-        left_idle[r_idx][21] = "navy_fabric.base"
-        left_idle[r_idx][22] = "navy_fabric.base"
-        left_idle[r_idx][23] = "navy_fabric.outline"
-
-    for r_idx in range(29, 41):
-        left_idle[r_idx][18] = "navy_fabric.outline"
-        left_idle[r_idx][19] = "navy_fabric.shadow"
-        left_idle[r_idx][20] = "navy_fabric.base"
-        left_idle[r_idx][21] = "navy_fabric.base"
-        left_idle[r_idx][22] = "navy_fabric.base"
-        left_idle[r_idx][23] = "navy_fabric.outline"
-
-    left_idle[40] = [0] * W
-    for c in range(18, 24):
-        left_idle[40][c] = "navy_fabric.outline"
+    left_idle[16:29, 19:24] = _enc(
+        "navy_fabric.outline", "navy_fabric.shadow",
+        "navy_fabric.base", "navy_fabric.base",
+        "navy_fabric.outline",
+    )
+    left_idle[29:41, 18:24] = _enc(
+        "navy_fabric.outline", "navy_fabric.shadow",
+        "navy_fabric.base", "navy_fabric.base", "navy_fabric.base",
+        "navy_fabric.outline",
+    )
+
+    left_idle[40] = 0
+    left_idle[40, 18:24] = KEY_TO_ID["navy_fabric.outline"]
 
     left_walk1 = shift_frame_cols(left_idle, -1)
     left_walk2 = shift_frame_cols(left_idle, 1)
@@ -360,31 +480,15 @@ def make_tabard_navy_gold():
     # -- UP idle: similar to down but plain back (no gold dots) --
     up_idle = empty_frame()
     # Upper back: side peeks (matching wider body)
-    for r in range(16, 29):
-        up_idle[r][12] = "navy_fabric.outline"
-        up_idle[r][13] = "navy_fabric.shadow"
-        up_idle[r][14] = "navy_fabric.base"
-        up_idle[r][34] = "navy_fabric.base"
-        up_idle[r][35] = "navy_fabric.shadow"
-        up_idle[r][36] = "navy_fabric.outline"
+    up_idle[16:29, 12:15] = left_peek
+    up_idle[16:29, 34:37] = right_peek
 
     # Lower back: plain navy (no gold), wider to match
-    for r_idx in range(28, 41):
-        if r_idx <= 37:
-            left_c, right_c = 16, 31
-        else:
-            left_c, right_c = 17, 30
-        for c in range(left_c, right_c + 1):
-            if c == left_c or c == right_c:
-                up_idle[r_idx][c] = "navy_fabric.outline"
-            elif c == left_c + 1 or c == right_c - 1:
-                up_idle[r_idx][c] = "navy_fabric.shadow"
-            else:
-                up_idle[r_idx][c] = "navy_fabric.base"
+    for slab in TABARD_SKIRT:
+        fill_tabard_panel(up_idle, *slab)
 
-    up_idle[40] = [0] * W
-    for c in range(17, 31):
-        up_idle[40][c] = "navy_fabric.outline"
+    up_idle[40] = 0
+    up_idle[40, 17:31] = KEY_TO_ID["navy_fabric.outline"]
 
     up_walk1 = shift_frame_cols(up_idle, -1)
     up_walk2 = shift_frame_cols(up_idle, 1)
@@ -415,6 +519,31 @@ def make_tabard_navy_gold():
 # LEFT: 8-10px side profile
 # UP: back plate ~18px wide, simpler shading
 # ===========================================================================
+# Rows carrying a horizontal gold trim band across the chestplate
+CHEST_TRIM_ROWS = (14, 18, 23, 27)
+
+# Front waist rows as (row, left col, right col): tapers 1px per side
+# after the first row
+CHEST_WAIST_ROWS = (
+    (24, 15, 32),
+    (25, 16, 31),
+    (26, 16, 31),
+)
+
+
+def draw_chest_panel(frame, top, bot, lc, rc, left_key, right_key):
+    """Draw a plain steel panel over rows top..bot, cols lc..rc.
+
+    Outline on the edge columns, `left_key` / `right_key` shading just
+    inside them and steel base between; rows in CHEST_TRIM_ROWS carry
+    gold trim across the whole interior instead.
+    """
+    fill_panel(frame, top, bot, lc, rc, "steel_armor.outline",
+               left_key, "steel_armor.base", right_key)
+    trim_rows = [r for r in CHEST_TRIM_ROWS if top <= r <= bot]
+    frame[trim_rows, lc + 1:rc] = KEY_TO_ID["gold_trim.base"]
+
+
 def make_chestplate_steel_gold():
     center = 24  # center column for the ridge (center of 48)
 
@@ -515,86 +644,27 @@ def make_chestplate_steel_gold():
     )
 
     # Rows 24-26: lower chest / waist - more shadow, slight taper
-    for r in range(24, 27):
-        taper = r - 23  # 1, 2, 3
-        lc = 15 + (taper // 2)
-        rc = 32 - (taper // 2)
-        width = rc - lc + 1
-        down_idle[r] = [0] * W
-        down_idle[r][lc] = "steel_armor.outline"
-        for c in range(lc + 1, center):
-            down_idle[r][c] = "steel_armor.shadow"
-        down_idle[r][center] = "steel_armor.highlight"  # center ridge
-        for c in range(center + 1, rc):
-            down_idle[r][c] = "steel_armor.shadow"
-        down_idle[r][rc] = "steel_armor.outline"
+    for r, lc, rc in CHEST_WAIST_ROWS:
+        down_idle[r, [lc, rc]] = KEY_TO_ID["steel_armor.outline"]
+        down_idle[r, lc + 1:rc] = KEY_TO_ID["steel_armor.shadow"]
+        down_idle[r, center] = KEY_TO_ID["steel_armor.highlight"]  # center ridge
 
     # Row 27: bottom gold trim edge
-    down_idle[27] = [0] * W
-    for c in range(16, 32):
-        down_idle[27][c] = "gold_trim.base"
+    down_idle[27, 16:32] = KEY_TO_ID["gold_trim.base"]
 
     # -- LEFT idle: side view, 8-10px wide (cols 17-26) --
     left_idle = empty_frame()
-
-    for r in range(14, 28):
-        left_idle[r] = [0] * W
-        left_col_start = 17
-        left_col_end = 26
-        left_idle[r][left_col_start] = "steel_armor.outline"
-        left_idle[r][left_col_end] = "steel_armor.outline"
-        for c in range(left_col_start + 1, left_col_end):
-            if r == 14 or r == 27:
-                left_idle[r][c] = "gold_trim.base"
-            elif r == 18 or r == 23:
-                left_idle[r][c] = "gold_trim.base"
-            elif c == left_col_start + 1:
-                left_idle[r][c] = "steel_armor.shadow"
-            elif c == left_col_end - 1:
-                left_idle[r][c] = "steel_armor.highlight"
-            else:
-                left_idle[r][c] = "steel_armor.base"
-
-    # Gold trim top and bottom
-    for c in range(17, 27):
-        left_idle[14][c] = "gold_trim.base"
-        left_idle[27][c] = "gold_trim.base"
-    left_idle[14][17] = "steel_armor.outline"
-    left_idle[14][26] = "steel_armor.outline"
-    left_idle[27][17] = "steel_armor.outline"
-    left_idle[27][26] = "steel_armor.outline"
+    draw_chest_panel(left_idle, 14, 27, 17, 26,
+                     "steel_armor.shadow", "steel_armor.highlight")
 
     # -- UP idle: back plate, ~18px wide, simpler --
     up_idle = empty_frame()
-    for r in range(14, 28):
-        up_idle[r] = [0] * W
-        if r <= 19:
-            lc, rc = 15, 32
-        elif r <= 24:
-            lc, rc = 15, 32
-        else:
-            lc, rc = 16, 31
-        up_idle[r][lc] = "steel_armor.outline"
-        up_idle[r][rc] = "steel_armor.outline"
-        for c in range(lc + 1, rc):
-            if r == 14 or r == 27:
-                up_idle[r][c] = "gold_trim.base"
-            elif r == 18 or r == 23:
-                up_idle[r][c] = "gold_trim.base"
-            else:
-                up_idle[r][c] = "steel_armor.base"
-        # Shadow near edges for non-trim rows
-        if r not in (14, 18, 23, 27):
-            up_idle[r][lc + 1] = "steel_armor.shadow"
-            up_idle[r][rc - 1] = "steel_armor.shadow"
-
-    # Gold trim top and bottom edge
-    for c in range(15, 33):
-        up_idle[14][c] = "gold_trim.base"
-    up_idle[14][15] = "steel_armor.outline"
-    up_idle[14][32] = "steel_armor.outline"
-    for c in range(16, 32):
-        up_idle[27][c] = "gold_trim.base"
+    draw_chest_panel(up_idle, 14, 24, 15, 32,
+                     "steel_armor.shadow", "steel_armor.shadow")
+    draw_chest_panel(up_idle, 25, 27, 16, 31,
+                     "steel_armor.shadow", "steel_armor.shadow")
+    # Bottom edge: gold trim runs over the outline columns too
+    up_idle[27, 16:32] = KEY_TO_ID["gold_trim.base"]
 
     # Static: same for all walk frames
     return {
@@ -607,9 +677,9 @@ def make_chestplate_steel_gold():
         "mirror_right_from_left": True,
         "walk_cycle": ["idle", "walk_1", "idle", "walk_2"],
         "directions": {
-            "down": {"idle": down_idle, "walk_1": copy.deepcopy(down_idle), "walk_2": copy.deepcopy(down_idle)},
-            "left": {"idle": left_idle, "walk_1": copy.deepcopy(left_idle), "walk_2": copy.deepcopy(left_idle)},
-            "up":   {"idle": up_idle,   "walk_1": copy.deepcopy(up_idle),   "walk_2": copy.deepcopy(up_idle)},
+            "down": static_walk(down_idle),
+            "left": static_walk(left_idle),
+            "up":   static_walk(up_idle),
         },
     }
 
@@ -624,17 +694,60 @@ def make_chestplate_steel_gold():
 # LEFT: One large pauldron on near shoulder.
 # UP: Both visible from behind.
 # ===========================================================================
-def make_pauldrons_segmented_fur():
-    def fur_pixel(c, r):
-        """Textured fur pattern with more variation."""
-        v = (c * 7 + r * 3) % 5
-        if v == 0:
-            return "fur_trim.highlight"
-        elif v <= 2:
-            return "fur_trim.base"
-        else:
-            return "fur_trim.shadow"
+# Fur texture for the trim rows 9-12, indexed [r - 9, c]: a pseudo-random
+# mix of highlight, base and shadow by (c * 7 + r * 3) % 5.
+FUR_TILE = _enc(
+    "fur_trim.highlight", "fur_trim.base", "fur_trim.base",
+    "fur_trim.shadow", "fur_trim.shadow",
+)[(np.arange(W) * 7 + np.arange(9, 13)[:, None] * 3) % 5]
+
+# 3 segmented plates, each 3px tall, as (top, bottom, outward offset):
+# plate 1 rows 13-15 no offset, plate 2 rows 16-18 1px, plate 3 rows 19-21 2px
+PAULDRON_PLATES = (
+    (13, 15, 0),
+    (16, 18, 1),
+    (19, 21, 2),
+)
 
+
+@lru_cache(maxsize=None)
+def fur_mask(width):
+    """Read-only 4 x `width` mask of the fur pixels that get drawn.
+
+    The top corners are rounded off and every third bottom pixel is
+    skipped for a ragged edge. Only two widths occur (11 and 14), so
+    each mask is built once.
+    """
+    mask = np.ones((4, width), dtype=np.bool_)
+    mask[0, [0, -1]] = False  # round top corners
+    mask[3, ::3] = False      # ragged bottom edge
+    mask.flags.writeable = False
+    return mask
+
+
+def draw_fur(frame, top, start, end):
+    """Draw the 4-row fur trim over cols start..end from row `top`.
+
+    Texture comes from FUR_TILE, shaped by fur_mask().
+    """
+    np.copyto(frame[top:top + 4, start:end + 1],
+              FUR_TILE[:, start:end + 1], where=fur_mask(end - start + 1))
+
+
+def draw_plate(frame, top, bot, start, end, top_key, bot_key):
+    """Draw one plate over rows top..bot, cols start..end.
+
+    Left/right columns are outline, the top and bottom rows take
+    `top_key` / `bot_key`, and the rest is steel base. Plates always
+    lie fully inside the frame, so no clipping is needed.
+    """
+    frame[top + 1:bot, start:end + 1] = KEY_TO_ID["steel_armor.base"]
+    frame[top, start:end + 1] = KEY_TO_ID[top_key]
+    frame[bot, start:end + 1] = KEY_TO_ID[bot_key]
+    frame[top:bot + 1, [start, end]] = KEY_TO_ID["steel_armor.outline"]
+
+
+def make_pauldrons_segmented_fur():
     def build_down_frame(shift_y=0):
         """Build front-facing pauldrons on wider body."""
         frame = empty_frame()
@@ -650,60 +763,19 @@ def make_pauldrons_segmented_fur():
                 inner_edge = 42
 
             # --- Fur trim: rows 9-12 (4 rows tall), extends 1px beyond plates ---
-            for r in range(9, 13):
-                actual_r = r + shift_y
-                if actual_r < 0 or actual_r >= H:
-                    continue
-                if side == "left":
-                    fur_start = base_col - 1  # 5
-                    fur_end = inner_edge + 1   # 15
-                else:
-                    fur_start = base_col - 1   # 33
-                    fur_end = inner_edge + 1    # 43
-                for c in range(fur_start, fur_end + 1):
-                    if 0 <= c < W:
-                        # Irregular edges: skip corners for organic look
-                        if r == 9 and (c == fur_start or c == fur_end):
-                            continue  # round top corners
-                        if r == 12 and ((c - fur_start) % 3 == 0):
-                            continue  # ragged bottom edge
-                        frame[actual_r][c] = fur_pixel(c, r)
+            draw_fur(frame, 9 + shift_y, base_col - 1, inner_edge + 1)
 
             # --- 3 segmented plates, each 3px tall, with 1px outward offset ---
-            # Plate 1: rows 13-15, no offset
-            # Plate 2: rows 16-18, 1px outward offset
-            # Plate 3: rows 19-21, 2px outward offset
-            plates = [
-                (13, 15, 0),  # plate 1
-                (16, 18, 1),  # plate 2
-                (19, 21, 2),  # plate 3
-            ]
-            for plate_top, plate_bot, offset in plates:
-                for r in range(plate_top, plate_bot + 1):
-                    actual_r = r + shift_y
-                    if actual_r < 0 or actual_r >= H:
-                        continue
-                    if side == "left":
-                        pc_start = base_col - offset
-                        pc_end = inner_edge
-                    else:
-                        pc_start = base_col
-                        pc_end = inner_edge + offset
-
-                    for c in range(pc_start, pc_end + 1):
-                        if 0 <= c < W:
-                            if c == pc_start or c == pc_end:
-                                frame[actual_r][c] = "steel_armor.outline"
-                            elif r == plate_top and c == pc_start + 1:
-                                frame[actual_r][c] = "steel_armor.highlight"
-                            elif r == plate_top:
-                                frame[actual_r][c] = "steel_armor.highlight"
-                            elif r == plate_bot and c == pc_end - 1:
-                                frame[actual_r][c] = "steel_armor.shadow"
-                            elif r == plate_bot:
-                                frame[actual_r][c] = "steel_armor.shadow"
-                            else:
-                                frame[actual_r][c] = "steel_armor.base"
+            for plate_top, plate_bot, offset in PAULDRON_PLATES:
+                if side == "left":
+                    pc_start = base_col - offset
+                    pc_end = inner_edge
+                else:
+                    pc_start = base_col
+                    pc_end = inner_edge + offset
+                draw_plate(frame, plate_top + shift_y, plate_bot + shift_y,
+                           pc_start, pc_end,
+                           "steel_armor.highlight", "steel_armor.shadow")
 
             # --- Gold clasps: where pauldron meets chest (plate 2 inner edge) ---
             for dr in range(16, 19):
@@ -712,17 +784,16 @@ def make_pauldrons_segmented_fur():
                     if side == "left":
                         cc = inner_edge
                         if cc < W:
-                            frame[clasp_r][cc] = "gold_trim.base"
+                            frame[clasp_r, cc] = KEY_TO_ID["gold_trim.base"]
                     else:
                         cc = base_col
                         if cc >= 0:
-                            frame[clasp_r][cc] = "gold_trim.base"
+                            frame[clasp_r, cc] = KEY_TO_ID["gold_trim.base"]
 
         return frame
 
     down_idle = build_down_frame(shift_y=0)
-    down_walk1 = build_down_frame(shift_y=-1)
-    down_walk2 = build_down_frame(shift_y=-1)
+    down_walk = build_down_frame(shift_y=-1)  # same 1px bob on both steps
 
     # -- LEFT direction: only near-side pauldron visible --
     def build_left_frame(shift_y=0):
@@ -732,56 +803,25 @@ def make_pauldrons_segmented_fur():
         inner_edge = 23
 
         # Fur trim: rows 9-12 (4 rows)
-        for r in range(9, 13):
-            actual_r = r + shift_y
-            if actual_r < 0 or actual_r >= H:
-                continue
-            fur_start = base_col - 1
-            fur_end = inner_edge + 1
-            for c in range(fur_start, fur_end + 1):
-                if 0 <= c < W:
-                    if r == 9 and (c == fur_start or c == fur_end):
-                        continue
-                    if r == 12 and ((c - fur_start) % 3 == 0):
-                        continue
-                    frame[actual_r][c] = fur_pixel(c, r)
+        draw_fur(frame, 9 + shift_y, base_col - 1, inner_edge + 1)
 
         # Plates
-        plates = [
-            (13, 15, 0),
-            (16, 18, 1),
-            (19, 21, 2),
-        ]
-        for plate_top, plate_bot, offset in plates:
-            for r in range(plate_top, plate_bot + 1):
-                actual_r = r + shift_y
-                if actual_r < 0 or actual_r >= H:
-                    continue
-                pc_start = base_col - offset
-                pc_end = inner_edge
-                for c in range(pc_start, pc_end + 1):
-                    if 0 <= c < W:
-                        if c == pc_start or c == pc_end:
-                            frame[actual_r][c] = "steel_armor.outline"
-                        elif r == plate_top:
-                            frame[actual_r][c] = "steel_armor.highlight"
-                        elif r == plate_bot:
-                            frame[actual_r][c] = "steel_armor.shadow"
-                        else:
-                            frame[actual_r][c] = "steel_armor.base"
+        for plate_top, plate_bot, offset in PAULDRON_PLATES:
+            draw_plate(frame, plate_top + shift_y, plate_bot + shift_y,
+                       base_col - offset, inner_edge,
+                       "steel_armor.highlight", "steel_armor.shadow")
 
         # Gold clasp at inner edge
         for dr in range(16, 19):
             clasp_r = dr + shift_y
             if 0 <= clasp_r < H:
                 if inner_edge < W:
-                    frame[clasp_r][inner_edge] = "gold_trim.base"
+                    frame[clasp_r, inner_edge] = KEY_TO_ID["gold_trim.base"]
 
         return frame
 
     left_idle = build_left_frame(shift_y=0)
-    left_walk1 = build_left_frame(shift_y=-1)
-    left_walk2 = build_left_frame(shift_y=-1)
+    left_walk = build_left_frame(shift_y=-1)  # same 1px bob on both steps
 
     # -- UP direction: both pauldrons from behind --
     def build_up_frame(shift_y=0):
@@ -795,52 +835,19 @@ def make_pauldrons_segmented_fur():
                 inner_edge = 42
 
             # Fur trim: rows 9-12
-            for r in range(9, 13):
-                actual_r = r + shift_y
-                if actual_r < 0 or actual_r >= H:
-                    continue
-                if side == "left":
-                    fur_start = base_col - 1
-                    fur_end = inner_edge + 1
-                else:
-                    fur_start = base_col - 1
-                    fur_end = inner_edge + 1
-                for c in range(fur_start, fur_end + 1):
-                    if 0 <= c < W:
-                        if r == 9 and (c == fur_start or c == fur_end):
-                            continue
-                        if r == 12 and ((c - fur_start) % 3 == 0):
-                            continue
-                        frame[actual_r][c] = fur_pixel(c, r)
+            draw_fur(frame, 9 + shift_y, base_col - 1, inner_edge + 1)
 
             # Plates (from behind, shading reversed - shadow on top, highlight on bottom)
-            plates = [
-                (13, 15, 0),
-                (16, 18, 1),
-                (19, 21, 2),
-            ]
-            for plate_top, plate_bot, offset in plates:
-                for r in range(plate_top, plate_bot + 1):
-                    actual_r = r + shift_y
-                    if actual_r < 0 or actual_r >= H:
-                        continue
-                    if side == "left":
-                        pc_start = base_col - offset
-                        pc_end = inner_edge
-                    else:
-                        pc_start = base_col
-                        pc_end = inner_edge + offset
-
-                    for c in range(pc_start, pc_end + 1):
-                        if 0 <= c < W:
-                            if c == pc_start or c == pc_end:
-                                frame[actual_r][c] = "steel_armor.outline"
-                            elif r == plate_top:
-                                frame[actual_r][c] = "steel_armor.shadow"
-                            elif r == plate_bot:
-                                frame[actual_r][c] = "steel_armor.base"
-                            else:
-                                frame[actual_r][c] = "steel_armor.base"
+            for plate_top, plate_bot, offset in PAULDRON_PLATES:
+                if side == "left":
+                    pc_start = base_col - offset
+                    pc_end = inner_edge
+                else:
+                    pc_start = base_col
+                    pc_end = inner_edge + offset
+                draw_plate(frame, plate_top + shift_y, plate_bot + shift_y,
+                           pc_start, pc_end,
+                           "steel_armor.shadow", "steel_armor.base")
 
             # Gold clasp
             for dr in range(16, 19):
@@ -848,16 +855,15 @@ def make_pauldrons_segmented_fur():
                 if 0 <= clasp_r < H:
                     if side == "left":
                         if inner_edge < W:
-                            frame[clasp_r][inner_edge] = "gold_trim.base"
+                            frame[clasp_r, inner_edge] = KEY_TO_ID["gold_trim.base"]
                     else:
                         if base_col >= 0:
-                            frame[clasp_r][base_col] = "gold_trim.base"
+                            frame[clasp_r, base_col] = KEY_TO_ID["gold_trim.base"]
 
         return frame
 
     up_idle = build_up_frame(shift_y=0)
-    up_walk1 = build_up_frame(shift_y=-1)
-    up_walk2 = build_up_frame(shift_y=-1)
+    up_walk = build_up_frame(shift_y=-1)  # same 1px bob on both steps
 
     return {
         "template_id": "pauldrons_segmented_fur",
@@ -869,9 +875,9 @@ def make_pauldrons_segmented_fur():
         "mirror_right_from_left": True,
         "walk_cycle": ["idle", "walk_1", "idle", "walk_2"],
         "directions": {
-            "down": {"idle": down_idle, "walk_1": down_walk1, "walk_2": down_walk2},
-            "left": {"idle": left_idle, "walk_1": left_walk1, "walk_2": left_walk2},
-            "up":   {"idle": up_idle,   "walk_1": up_walk1,   "walk_2": up_walk2},
+            "down": bob_walk(down_idle, down_walk),
+            "left": bob_walk(left_idle, left_walk),
+            "up":   bob_walk(up_idle, up_walk),
         },
     }
 
@@ -886,46 +892,31 @@ def make_pauldrons_segmented_fur():
 # UP: both bracers from behind
 # ===========================================================================
 def make_bracers_steel():
+    def draw_bracer(frame, lc, left_key, right_key):
+        """Draw a 4px-wide bracer over rows 22-28 starting at col `lc`.
+
+        Rows 22 and 28 are outline; between them the left and right
+        columns take `left_key` / `right_key`, with a gold trim stripe
+        across the middle (row 25) and steel base elsewhere.
+        """
+        frame[23:28, lc + 1:lc + 3] = KEY_TO_ID["steel_armor.base"]
+        frame[25, lc + 1:lc + 3] = KEY_TO_ID["gold_trim.base"]
+        frame[23:28, lc] = KEY_TO_ID[left_key]
+        frame[23:28, lc + 3] = KEY_TO_ID[right_key]
+        frame[[22, 28], lc:lc + 4] = KEY_TO_ID["steel_armor.outline"]
+
     def build_down_frame(left_shift=0, right_shift=0):
         """Down-facing bracers on both arms.
         Left arm cols 10-13, right arm cols 35-38.
         Bracers rows 22-28 (7px tall).
         """
         frame = empty_frame()
-
-        # Left bracer: cols 10-13 (4px wide), rows 22-28
-        lc_start = 10 + left_shift
-        for r in range(22, 29):
-            for c in range(lc_start, lc_start + 4):
-                if 0 <= c < W:
-                    if r == 22 or r == 28:
-                        frame[r][c] = "steel_armor.outline"
-                    elif c == lc_start:
-                        frame[r][c] = "steel_armor.shadow"
-                    elif c == lc_start + 3:
-                        frame[r][c] = "steel_armor.highlight"
-                    elif r == 25:
-                        # Gold trim horizontal stripe in the middle
-                        frame[r][c] = "gold_trim.base"
-                    else:
-                        frame[r][c] = "steel_armor.base"
-
-        # Right bracer: cols 35-38 (4px wide), rows 22-28
-        rc_start = 35 + right_shift
-        for r in range(22, 29):
-            for c in range(rc_start, rc_start + 4):
-                if 0 <= c < W:
-                    if r == 22 or r == 28:
-                        frame[r][c] = "steel_armor.outline"
-                    elif c == rc_start:
-                        frame[r][c] = "steel_armor.highlight"
-                    elif c == rc_start + 3:
-                        frame[r][c] = "steel_armor.shadow"
-                    elif r == 25:
-                        frame[r][c] = "gold_trim.base"
-                    else:
-                        frame[r][c] = "steel_armor.base"
-
+        # Left bracer: cols 10-13 (4px wide), shadow on the outer side
+        draw_bracer(frame, 10 + left_shift,
+                    "steel_armor.shadow", "steel_armor.highlight")
+        # Right bracer: cols 35-38 (4px wide), mirrored shading
+        draw_bracer(frame, 35 + right_shift,
+                    "steel_armor.highlight", "steel_armor.shadow")
         return frame
 
     down_idle = build_down_frame(0, 0)
@@ -935,20 +926,8 @@ def make_bracers_steel():
     # -- LEFT: only near arm bracer visible, cols 16-19 --
     def build_left_frame(shift=0):
         frame = empty_frame()
-        lc_start = 16 + shift
-        for r in range(22, 29):
-            for c in range(lc_start, lc_start + 4):
-                if 0 <= c < W:
-                    if r == 22 or r == 28:
-                        frame[r][c] = "steel_armor.outline"
-                    elif c == lc_start:
-                        frame[r][c] = "steel_armor.shadow"
-                    elif c == lc_start + 3:
-                        frame[r][c] = "steel_armor.highlight"
-                    elif r == 25:
-                        frame[r][c] = "gold_trim.base"
-                    else:
-                        frame[r][c] = "steel_armor.base"
+        draw_bracer(frame, 16 + shift,
+                    "steel_armor.shadow", "steel_armor.highlight")
         return frame
 
     left_idle = build_left_frame(0)
@@ -958,39 +937,12 @@ def make_bracers_steel():
     # -- UP: both bracers visible from behind --
     def build_up_frame(left_shift=0, right_shift=0):
         frame = empty_frame()
-
         # Left bracer from behind: cols 10-13
-        lc_start = 10 + left_shift
-        for r in range(22, 29):
-            for c in range(lc_start, lc_start + 4):
-                if 0 <= c < W:
-                    if r == 22 or r == 28:
-                        frame[r][c] = "steel_armor.outline"
-                    elif c == lc_start:
-                        frame[r][c] = "steel_armor.highlight"
-                    elif c == lc_start + 3:
-                        frame[r][c] = "steel_armor.shadow"
-                    elif r == 25:
-                        frame[r][c] = "gold_trim.base"
-                    else:
-                        frame[r][c] = "steel_armor.base"
-
+        draw_bracer(frame, 10 + left_shift,
+                    "steel_armor.highlight", "steel_armor.shadow")
         # Right bracer from behind: cols 35-38
-        rc_start = 35 + right_shift
-        for r in range(22, 29):
-            for c in range(rc_start, rc_start + 4):
-                if 0 <= c < W:
-                    if r == 22 or r == 28:
-                        frame[r][c] = "steel_armor.outline"
-                    elif c == rc_start:
-                        frame[r][c] = "steel_armor.shadow"
-                    elif c == rc_start + 3:
-                        frame[r][c] = "steel_armor.highlight"
-                    elif r == 25:
-                        frame[r][c] = "gold_trim.base"
-                    else:
-                        frame[r][c] = "steel_armor.base"
-
+        draw_bracer(frame, 35 + right_shift,
+                    "steel_armor.shadow", "steel_armor.highlight")
         return frame
 
     up_idle = build_up_frame(0, 0)
@@ -1043,7 +995,7 @@ def main():
         for d_name, d_frames in tpl["directions"].items():
             for f_name, frame in d_frames.items():
                 frame_count += 1
-                px = sum(1 for row in frame for val in row if val != 0)
+                px = int(np.count_nonzero(frame))
                 total_pixels += px
         avg_px = total_pixels // frame_count if frame_count else 0
         print(f"    {tpl['template_id']}: {frame_count} frames, avg {avg_px} non-transparent px/frame")
@@ -26,6 +26,14 @@ Templates generated:
 import json
 import os
 import sys
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json fallback writes the same bytes
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -34,7 +42,7 @@ W, H = 48, 48
 T = 0  # transparent
 
 # Valid palette keys (dot-notation) from metz_master_palette.json
-VALID_KEYS = {
+VALID_KEYS = frozenset({
     # skin
     "skin.base", "skin.shadow", "skin.highlight", "skin.outline",
     # hair
@@ -64,100 +72,259 @@ VALID_KEYS = {
     "sword.grip", "sword.pommel", "sword.outline",
     # cape
     "cape.primary", "cape.shadow", "cape.highlight", "cape.lining", "cape.outline",
-}
-
-# Shortcuts for readability
-BLb  = "brown_leather.base"
-BLs  = "brown_leather.shadow"
-BLh  = "brown_leather.highlight"
-BLo  = "brown_leather.outline"
-BLbu = "brown_leather.buckle"
-
-GTb  = "gold_trim.base"
-GTs  = "gold_trim.shadow"
-GTh  = "gold_trim.highlight"
-GTo  = "gold_trim.outline"
-
-SAb  = "steel_armor.base"
-SAs  = "steel_armor.shadow"
-SAh  = "steel_armor.highlight"
-SAB  = "steel_armor.bright"
-SAo  = "steel_armor.outline"
-
-SWbl = "sword.blade"
-SWe  = "sword.edge"
-SWsh = "sword.shadow"
-SWg  = "sword.guard"
-SWgr = "sword.grip"
-SWp  = "sword.pommel"
-SWo  = "sword.outline"
-
-SHf  = "shield.field"
-SHb  = "shield.border"
-SHr  = "shield.rim"
-SHc  = "shield.crest"
-
-CPp  = "cape.primary"
-CPs  = "cape.shadow"
-CPh  = "cape.highlight"
-CPl  = "cape.lining"
-CPo  = "cape.outline"
-
-NFb  = "navy_fabric.base"
-NFs  = "navy_fabric.shadow"
+})
+
+# Palette ids — frames are stored as uint8 arrays indexing into this tuple
+# (0 = transparent). Keys are only materialized for JSON output, through
+# ID_TO_KEY.
+PALETTE_KEYS = (T,) + tuple(sorted(VALID_KEYS))
+KEY_TO_ID = {key: i for i, key in enumerate(PALETTE_KEYS)}
+ID_TO_KEY = np.array(PALETTE_KEYS, dtype=object)
+
+# Lookup table over every possible byte value: True for ids in PALETTE_KEYS
+VALID_MASK = np.zeros(256, dtype=np.bool_)
+VALID_MASK[:len(PALETTE_KEYS)] = True
+
+# Shortcuts for readability (palette ids)
+BLb  = KEY_TO_ID["brown_leather.base"]
+BLs  = KEY_TO_ID["brown_leather.shadow"]
+BLh  = KEY_TO_ID["brown_leather.highlight"]
+BLo  = KEY_TO_ID["brown_leather.outline"]
+BLbu = KEY_TO_ID["brown_leather.buckle"]
+
+GTb  = KEY_TO_ID["gold_trim.base"]
+GTs  = KEY_TO_ID["gold_trim.shadow"]
+GTh  = KEY_TO_ID["gold_trim.highlight"]
+GTo  = KEY_TO_ID["gold_trim.outline"]
+
+SAb  = KEY_TO_ID["steel_armor.base"]
+SAs  = KEY_TO_ID["steel_armor.shadow"]
+SAh  = KEY_TO_ID["steel_armor.highlight"]
+SAB  = KEY_TO_ID["steel_armor.bright"]
+SAo  = KEY_TO_ID["steel_armor.outline"]
+
+SWbl = KEY_TO_ID["sword.blade"]
+SWe  = KEY_TO_ID["sword.edge"]
+SWsh = KEY_TO_ID["sword.shadow"]
+SWg  = KEY_TO_ID["sword.guard"]
+SWgr = KEY_TO_ID["sword.grip"]
+SWp  = KEY_TO_ID["sword.pommel"]
+SWo  = KEY_TO_ID["sword.outline"]
+
+SHf  = KEY_TO_ID["shield.field"]
+SHb  = KEY_TO_ID["shield.border"]
+SHr  = KEY_TO_ID["shield.rim"]
+SHc  = KEY_TO_ID["shield.crest"]
+
+CPp  = KEY_TO_ID["cape.primary"]
+CPs  = KEY_TO_ID["cape.shadow"]
+CPh  = KEY_TO_ID["cape.highlight"]
+CPl  = KEY_TO_ID["cape.lining"]
+CPo  = KEY_TO_ID["cape.outline"]
+
+NFb  = KEY_TO_ID["navy_fabric.base"]
+NFs  = KEY_TO_ID["navy_fabric.shadow"]
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def empty_frame():
-    """Return a 48x48 grid of transparent."""
-    return [[T] * W for _ in range(H)]
+    """Return a 48x48 transparent frame (uint8 array of palette ids)."""
+    return np.zeros((H, W), dtype=np.uint8)
 
 
 def set_pixel(frame, r, c, val):
     """Safely set a single pixel."""
     if 0 <= r < H and 0 <= c < W:
-        frame[r][c] = val
+        frame[r, c] = val
 
 
 def set_rect(frame, r1, c1, r2, c2, val):
-    """Fill a rectangle [r1..r2] x [c1..c2] inclusive."""
-    for rr in range(r1, r2 + 1):
-        for cc in range(c1, c2 + 1):
-            set_pixel(frame, rr, cc, val)
+    """Fill a rectangle [r1..r2] x [c1..c2] inclusive, clipped to the frame."""
+    frame[max(0, r1):min(H, r2 + 1), max(0, c1):min(W, c2 + 1)] = val
+
+
+def pixel_table(*pixels):
+    """Pack (r, c, val) triples into parallel (rows, cols, vals) arrays for stamp().
+
+    Coordinates must be distinct; a later triple does not reliably win over
+    an earlier one at the same pixel.
+    """
+    rs, cs, vs = zip(*pixels)
+    return np.array(rs), np.array(cs), np.array(vs, dtype=np.uint8)
 
 
-def copy_frame(frame):
-    """Deep copy a frame."""
-    return [row[:] for row in frame]
+def stamp(frame, table):
+    """Write a pixel_table() into a frame with one fancy-indexed store."""
+    rs, cs, vs = table
+    frame[rs, cs] = vs
+
+
+def static_walk(frame):
+    """Frames for equipment that does not move during the walk cycle.
+
+    idle, walk_1 and walk_2 share one array, marked read-only so no later
+    edit can leak between them.
+    """
+    frame.flags.writeable = False
+    return {"idle": frame, "walk_1": frame, "walk_2": frame}
 
 
 def shift_frame(frame, dr, dc):
-    """Return a new frame shifted by (dr, dc) pixels."""
+    """Return a new frame shifted by (dr, dc) pixels.
+
+    Pixels shifted past an edge are dropped; vacated cells are transparent.
+    """
+    nf = empty_frame()
+    if abs(dr) >= H or abs(dc) >= W:
+        return nf
+    nf[max(0, dr):H + min(0, dr), max(0, dc):W + min(0, dc)] = \
+        frame[max(0, -dr):H - max(0, dr), max(0, -dc):W - max(0, dc)]
+    return nf
+
+
+def sway_rows(frame, top, bot, dc):
+    """Return a copy of `frame` with rows [top..bot] shifted dc cols (positive = right).
+
+    Pixels pushed past the edge are dropped; other rows are unchanged.
+    """
+    nf = frame.copy()
+    nf[top:bot + 1] = T
+    if abs(dc) >= W:
+        return nf
+    if dc >= 0:
+        nf[top:bot + 1, dc:] = frame[top:bot + 1, :W - dc]
+    else:
+        nf[top:bot + 1, :W + dc] = frame[top:bot + 1, -dc:]
+    return nf
+
+
+def shift_span(lo, hi, d, n):
+    """Return (src, dst) slices moving indices [lo..hi] by d, clipped to [0, n).
+
+    Indices that would land outside the frame are dropped; if none remain,
+    both slices are empty.
+    """
+    dst_lo, dst_hi = max(lo + d, 0), min(hi + d, n - 1)
+    if dst_lo > dst_hi:
+        return slice(0, 0), slice(0, 0)
+    return slice(dst_lo - d, dst_hi - d + 1), slice(dst_lo, dst_hi + 1)
+
+
+def shift_split(frame, top, bot, split_col, d_left, d_right):
+    """Return a new frame with rows [top..bot] shifted vertically in two halves.
+
+    Columns left of `split_col` move by `d_left` rows and the rest by
+    `d_right` (positive = down), e.g. one leg stepping forward while the
+    other steps back. Pixels outside the band, or shifted past the top or
+    bottom edge, are dropped.
+    """
     nf = empty_frame()
-    for r in range(H):
-        for c in range(W):
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < H and 0 <= nc < W and frame[r][c] != T:
-                nf[nr][nc] = frame[r][c]
+    src, dst = shift_span(top, bot, d_left, H)
+    nf[dst, :split_col] = frame[src, :split_col]
+    src, dst = shift_span(top, bot, d_right, H)
+    nf[dst, split_col:] = frame[src, split_col:]
     return nf
 
 
+def stride_walk(idle, top, bot, lc, rc, dr):
+    """Return (walk_1, walk_2) for a side-view leg stride.
+
+    Each frame draws the leg in rows [top..bot] x cols [lc..rc] twice: the
+    front leg `dr` rows down and one col over, then the back leg `dr` rows
+    up and one col the other way on top of it (opaque pixels only). In
+    walk_1 the front leg steps left (forward for the left-facing view);
+    walk_2 is the opposite stride. Pixels shifted past an edge are dropped.
+    Both frames are built in place on one zeroed (2, H, W) buffer.
+    """
+    buf = np.zeros((2, H, W), dtype=np.uint8)
+    for frame, dc in ((buf[0], -1), (buf[1], 1)):
+        src_r, dst_r = shift_span(top, bot, dr, H)
+        src_c, dst_c = shift_span(lc, rc, dc, W)
+        frame[dst_r, dst_c] = idle[src_r, src_c]
+        src_r, dst_r = shift_span(top, bot, -dr, H)
+        src_c, dst_c = shift_span(lc, rc, -dc, W)
+        back = idle[src_r, src_c]
+        np.copyto(frame[dst_r, dst_c], back, where=back != T)
+    return buf[0], buf[1]
+
+
 def validate_frame(frame, template_id, direction, anim):
-    """Validate frame dimensions and palette keys. Returns list of errors."""
+    """Validate frame dimensions and palette ids. Returns list of errors.
+
+    The per-pixel check is a single VALID_MASK lookup over the frame; only
+    failing pixels are visited in Python, to report them.
+    """
+    label = f"{template_id}/{direction}/{anim}"
+    if frame.dtype != np.uint8:
+        return [f"{label}: expected uint8 palette ids, got {frame.dtype}"]
     errors = []
-    if len(frame) != H:
-        errors.append(f"{template_id}/{direction}/{anim}: {len(frame)} rows (expected {H})")
-    for ri, r in enumerate(frame):
-        if len(r) != W:
-            errors.append(f"{template_id}/{direction}/{anim} row {ri}: {len(r)} cols (expected {W})")
-        for ci, v in enumerate(r):
-            if v != T and v not in VALID_KEYS:
-                errors.append(f"{template_id}/{direction}/{anim} [{ri},{ci}]: invalid key '{v}'")
+    rows, cols = frame.shape
+    if rows != H:
+        errors.append(f"{label}: {rows} rows (expected {H})")
+    if cols != W:
+        errors.append(f"{label}: {cols} cols (expected {W})")
+    for ri, ci in np.argwhere(~VALID_MASK[frame]):
+        errors.append(f"{label} [{ri},{ci}]: invalid palette id {int(frame[ri, ci])}")
     return errors
 
 
+def template_json(tmpl, decoded=None):
+    """Return a copy of `tmpl` with frames decoded to palette-key lists.
+
+    A single gather through ID_TO_KEY per frame; 0 stays the integer 0.
+    A frame identical to an earlier frame of the same direction is written
+    as that frame's name (e.g. ``"walk_1": "idle"``) and the template is
+    flagged with ``"frame_aliases": true``, as in group 1's templates.
+    `decoded` maps frame bytes to an already-decoded grid, so frames repeated
+    across templates are decoded once and share one list. Pass the same dict
+    for every template in a run.
+    """
+    if decoded is None:
+        decoded = {}
+    out = dict(tmpl)
+    out["directions"] = {}
+    for d_name, anims in tmpl["directions"].items():
+        frames = {}
+        first_name = {}  # frame bytes -> name it was first written under
+        for a_name, frame in anims.items():
+            key = frame.tobytes()
+            if key in first_name:
+                frames[a_name] = first_name[key]
+                out["frame_aliases"] = True
+                continue
+            first_name[key] = a_name
+            grid = decoded.get(key)
+            if grid is None:
+                grid = decoded[key] = ID_TO_KEY[frame].tolist()
+            frames[a_name] = grid
+        out["directions"][d_name] = frames
+    return out
+
+
+def write_json(obj, path):
+    """Write `obj` to `path` as 2-space-indented JSON.
+
+    Serialized with orjson when available (OPT_INDENT_2 matches
+    json.dumps(indent=2) byte for byte). Skips the write when the file
+    already holds the same bytes. Returns True if the file was written.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    try:
+        with open(path, "rb") as fh:
+            if fh.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as fh:
+        fh.write(data)
+    return True
+
+
 def make_template(template_id, z_order, z_order_override, directions):
     """Construct the full template dict."""
     tmpl = {
@@ -178,6 +345,12 @@ def make_template(template_id, z_order, z_order_override, directions):
 # ===================================================================
 # TEMPLATE 1 — Leather Belt with Pouch (z:5)
 # ===================================================================
+# Belt band rows 27-29, top to bottom: outline, base leather, shadow.
+# A column vector, so assigning it to a rows 27-29 slice broadcasts across
+# every column.
+BELT_BAND = np.array([[BLo], [BLb], [BLs]], dtype=np.uint8)
+
+
 def generate_belt():
     """
     Belt across wider torso.
@@ -188,14 +361,7 @@ def generate_belt():
     # --- DOWN ---
     down_idle = empty_frame()
     # Belt band: rows 27-29, cols 15-33
-    for r in range(27, 30):
-        for c in range(15, 34):
-            if r == 27:
-                set_pixel(down_idle, r, c, BLo)    # top outline
-            elif r == 29:
-                set_pixel(down_idle, r, c, BLs)    # bottom shadow
-            else:
-                set_pixel(down_idle, r, c, BLb)    # base leather
+    down_idle[27:30, 15:34] = BELT_BAND
 
     # Gold buckle: center (cols 23-25, rows 27-29)
     set_rect(down_idle, 27, 23, 29, 25, GTb)
@@ -205,66 +371,38 @@ def generate_belt():
     # Hip pouch: right side cols 29-32, rows 28-31
     set_rect(down_idle, 28, 29, 31, 32, BLb)
     # Pouch outline
-    for c in range(29, 33):
-        set_pixel(down_idle, 28, c, BLo)
-    for r in range(28, 32):
-        set_pixel(down_idle, r, 29, BLo)
-        set_pixel(down_idle, r, 32, BLo)
+    down_idle[28, 29:33] = BLo
+    down_idle[28:32, [29, 32]] = BLo
     # Pouch bottom shadow
-    for c in range(29, 33):
-        set_pixel(down_idle, 31, c, BLs)
+    down_idle[31, 29:33] = BLs
     # Buckle clasp on pouch
     set_pixel(down_idle, 29, 30, BLbu)
     set_pixel(down_idle, 30, 30, BLbu)
 
-    down_w1 = copy_frame(down_idle)
-    down_w2 = copy_frame(down_idle)
-
     # --- LEFT ---
     left_idle = empty_frame()
     # Belt band from side: cols 18-22 (4-5px strip), rows 27-29
-    for r in range(27, 30):
-        for c in range(18, 23):
-            if r == 27:
-                set_pixel(left_idle, r, c, BLo)
-            elif r == 29:
-                set_pixel(left_idle, r, c, BLs)
-            else:
-                set_pixel(left_idle, r, c, BLb)
+    left_idle[27:30, 18:23] = BELT_BAND
     # Buckle at front (left-facing, front = left ~ col 18-19)
     set_rect(left_idle, 27, 18, 28, 19, GTb)
     set_pixel(left_idle, 27, 18, GTh)
     # Pouch peeking on far hip (cols 21-23, rows 28-31)
     set_rect(left_idle, 28, 21, 31, 23, BLb)
-    for c in range(21, 24):
-        set_pixel(left_idle, 31, c, BLs)
+    left_idle[31, 21:24] = BLs
     set_pixel(left_idle, 29, 22, BLbu)
 
-    left_w1 = copy_frame(left_idle)
-    left_w2 = copy_frame(left_idle)
-
     # --- UP ---
     up_idle = empty_frame()
     # Belt band: rows 27-29, cols 15-33 (same width as down)
-    for r in range(27, 30):
-        for c in range(15, 34):
-            if r == 27:
-                set_pixel(up_idle, r, c, BLo)
-            elif r == 29:
-                set_pixel(up_idle, r, c, BLs)
-            else:
-                set_pixel(up_idle, r, c, BLb)
+    up_idle[27:30, 15:34] = BELT_BAND
     # Pouch barely visible — just 2px peeking right side
     set_pixel(up_idle, 28, 33, BLb)
     set_pixel(up_idle, 29, 33, BLs)
 
-    up_w1 = copy_frame(up_idle)
-    up_w2 = copy_frame(up_idle)
-
     directions = {
-        "down": {"idle": down_idle, "walk_1": down_w1, "walk_2": down_w2},
-        "left": {"idle": left_idle, "walk_1": left_w1, "walk_2": left_w2},
-        "up":   {"idle": up_idle,   "walk_1": up_w1,   "walk_2": up_w2},
+        "down": static_walk(down_idle),
+        "left": static_walk(left_idle),
+        "up":   static_walk(up_idle),
     }
     return make_template("belt_captain_leather", 5, {}, directions)
 
@@ -272,6 +410,65 @@ def generate_belt():
 # ===================================================================
 # TEMPLATE 2 — Steel Leg Greaves (z:3)
 # ===================================================================
+# Column stripes for one 6px greave, left to right. Facing down the outline
+# is on the outer edge of each leg; facing up the shading is mirrored.
+GREAVE_OUTLINE_LEFT  = (SAo, SAh, SAb, SAb, SAb, SAs)
+GREAVE_OUTLINE_RIGHT = (SAs, SAb, SAb, SAb, SAh, SAo)
+# Knee guard bumps (rows 32-33) sit one col outside each edge of both greaves
+KNEE_COLS = [14, 21, 27, 34]
+
+
+@lru_cache(maxsize=None)
+def _greave_down_idle():
+    """Idle greaves, facing down. Cached and read-only; copy before editing."""
+    f = empty_frame()
+    # Left greave: cols 15-20, rows 30-40 (outer outline, highlight, inner shadow)
+    f[30:41, 15:21] = GREAVE_OUTLINE_LEFT
+    # Right greave: cols 28-33, rows 30-40
+    f[30:41, 28:34] = GREAVE_OUTLINE_RIGHT
+    # Knee guards: bump out at rows 32-33
+    f[32:34, KNEE_COLS] = (SAo, SAs, SAs, SAo)
+    # Gold trim at top (row 30)
+    f[30, 15:21] = GTb
+    set_pixel(f, 30, 15, GTs)  # shadow on edge
+    f[30, 28:34] = GTb
+    set_pixel(f, 30, 33, GTs)
+    f.flags.writeable = False
+    return f
+
+
+@lru_cache(maxsize=None)
+def _greave_left_idle():
+    """Idle greaves, facing left. Cached and read-only; copy before editing."""
+    f = empty_frame()
+    # Single leg visible from side: cols 18-25 (~8px), rows 30-40
+    f[30:41, 18:26] = (SAo, SAh, SAb, SAb, SAb, SAb, SAb, SAs)
+    # Knee guard bump
+    f[32:34, [17, 26]] = (SAo, SAs)
+    # Gold trim at top
+    f[30, 18:26] = GTb
+    set_pixel(f, 30, 18, GTs)
+    f.flags.writeable = False
+    return f
+
+
+@lru_cache(maxsize=None)
+def _greave_up_idle():
+    """Idle greaves, facing up. Cached and read-only; copy before editing."""
+    f = empty_frame()
+    # Left greave: cols 15-20, rows 30-40 (shadow/highlight reversed from down)
+    f[30:41, 15:21] = GREAVE_OUTLINE_RIGHT
+    # Right greave: cols 28-33
+    f[30:41, 28:34] = GREAVE_OUTLINE_LEFT
+    # Knee guards
+    f[32:34, KNEE_COLS] = (SAs, SAo, SAo, SAs)
+    # Gold trim at top
+    f[30, 15:21] = GTb
+    f[30, 28:34] = GTb
+    f.flags.writeable = False
+    return f
+
+
 def generate_greaves():
     """
     Greaves on new leg positions.
@@ -280,203 +477,26 @@ def generate_greaves():
     LEFT: single leg view, cols 18-25, rows 30-40.
     Walk: legs shift during stride (+/-1px vertical).
     """
-
-    def _greave_down_idle():
-        f = empty_frame()
-        # Left greave: cols 15-20, rows 30-40
-        for r in range(30, 41):
-            for c in range(15, 21):
-                if c == 15:
-                    set_pixel(f, r, c, SAo)       # outer outline
-                elif c == 20:
-                    set_pixel(f, r, c, SAs)       # inner shadow
-                elif c == 16:
-                    set_pixel(f, r, c, SAh)       # highlight outer
-                else:
-                    set_pixel(f, r, c, SAb)       # base
-        # Right greave: cols 28-33, rows 30-40
-        for r in range(30, 41):
-            for c in range(28, 34):
-                if c == 33:
-                    set_pixel(f, r, c, SAo)
-                elif c == 28:
-                    set_pixel(f, r, c, SAs)
-                elif c == 32:
-                    set_pixel(f, r, c, SAh)
-                else:
-                    set_pixel(f, r, c, SAb)
-        # Knee guards: bump out at rows 32-33
-        for r in (32, 33):
-            set_pixel(f, r, 14, SAo)
-            set_pixel(f, r, 21, SAs)
-            set_pixel(f, r, 27, SAs)
-            set_pixel(f, r, 34, SAo)
-        # Gold trim at top (row 30)
-        for c in range(15, 21):
-            set_pixel(f, 30, c, GTb)
-        set_pixel(f, 30, 15, GTs)  # shadow on edge
-        for c in range(28, 34):
-            set_pixel(f, 30, c, GTb)
-        set_pixel(f, 30, 33, GTs)
-        return f
-
     down_idle = _greave_down_idle()
 
     # walk_1: left leg forward (shift down 1px), right leg back (shift up 1px)
-    down_w1 = empty_frame()
-    for r in range(30, 41):
-        for c in range(W):
-            v = down_idle[r][c]
-            if v != T:
-                if c <= 23:  # left greave
-                    set_pixel(down_w1, min(r + 1, 46), c, v)
-                else:        # right greave
-                    set_pixel(down_w1, max(r - 1, 0), c, v)
-    # Re-apply knee guard bumps shifted
-    for r in (32, 33):
-        for c_val in [(14, SAo), (21, SAs)]:
-            set_pixel(down_w1, min(r + 1, 46), c_val[0], c_val[1])
-        for c_val in [(27, SAs), (34, SAo)]:
-            set_pixel(down_w1, max(r - 1, 0), c_val[0], c_val[1])
-
+    # (knee guard bumps are in the leg band, so they shift with it)
+    down_w1 = shift_split(down_idle, 30, 40, 24, 1, -1)
     # walk_2: opposite
-    down_w2 = empty_frame()
-    for r in range(30, 41):
-        for c in range(W):
-            v = down_idle[r][c]
-            if v != T:
-                if c <= 23:
-                    set_pixel(down_w2, max(r - 1, 0), c, v)
-                else:
-                    set_pixel(down_w2, min(r + 1, 46), c, v)
-    for r in (32, 33):
-        for c_val in [(14, SAo), (21, SAs)]:
-            set_pixel(down_w2, max(r - 1, 0), c_val[0], c_val[1])
-        for c_val in [(27, SAs), (34, SAo)]:
-            set_pixel(down_w2, min(r + 1, 46), c_val[0], c_val[1])
+    down_w2 = shift_split(down_idle, 30, 40, 24, -1, 1)
 
     # --- LEFT ---
-    def _greave_left_idle():
-        f = empty_frame()
-        # Single leg visible from side: cols 18-25 (~8px), rows 30-40
-        for r in range(30, 41):
-            for c in range(18, 26):
-                if c == 18:
-                    set_pixel(f, r, c, SAo)
-                elif c == 25:
-                    set_pixel(f, r, c, SAs)
-                elif c == 19:
-                    set_pixel(f, r, c, SAh)
-                else:
-                    set_pixel(f, r, c, SAb)
-        # Knee guard bump
-        for r in (32, 33):
-            set_pixel(f, r, 17, SAo)
-            set_pixel(f, r, 26, SAs)
-        # Gold trim at top
-        for c in range(18, 26):
-            set_pixel(f, 30, c, GTb)
-        set_pixel(f, 30, 18, GTs)
-        return f
-
     left_idle = _greave_left_idle()
 
     # walk_1: front leg forward (down 2px, left 1px), back leg behind (up 2px, right 1px)
-    left_w1 = empty_frame()
-    for r in range(30, 41):
-        for c in range(17, 27):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w1, min(r + 2, 46), c - 1, v)
-    # Back leg peek
-    for r in range(30, 41):
-        for c in range(17, 27):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w1, max(r - 2, 0), c + 1, v)
-
     # walk_2: opposite stride
-    left_w2 = empty_frame()
-    for r in range(30, 41):
-        for c in range(17, 27):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w2, min(r + 2, 46), c + 1, v)
-    for r in range(30, 41):
-        for c in range(17, 27):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w2, max(r - 2, 0), c - 1, v)
+    left_w1, left_w2 = stride_walk(left_idle, 30, 40, 17, 26, 2)
 
     # --- UP ---
-    def _greave_up_idle():
-        f = empty_frame()
-        # Left greave: cols 15-20, rows 30-40 (shadow/highlight reversed from down)
-        for r in range(30, 41):
-            for c in range(15, 21):
-                if c == 15:
-                    set_pixel(f, r, c, SAs)
-                elif c == 20:
-                    set_pixel(f, r, c, SAo)
-                elif c == 19:
-                    set_pixel(f, r, c, SAh)
-                else:
-                    set_pixel(f, r, c, SAb)
-        # Right greave: cols 28-33
-        for r in range(30, 41):
-            for c in range(28, 34):
-                if c == 33:
-                    set_pixel(f, r, c, SAs)
-                elif c == 28:
-                    set_pixel(f, r, c, SAo)
-                elif c == 29:
-                    set_pixel(f, r, c, SAh)
-                else:
-                    set_pixel(f, r, c, SAb)
-        # Knee guards
-        for r in (32, 33):
-            set_pixel(f, r, 14, SAs)
-            set_pixel(f, r, 21, SAo)
-            set_pixel(f, r, 27, SAo)
-            set_pixel(f, r, 34, SAs)
-        # Gold trim at top
-        for c in range(15, 21):
-            set_pixel(f, 30, c, GTb)
-        for c in range(28, 34):
-            set_pixel(f, 30, c, GTb)
-        return f
-
     up_idle = _greave_up_idle()
 
-    up_w1 = empty_frame()
-    for r in range(30, 41):
-        for c in range(W):
-            v = up_idle[r][c]
-            if v != T:
-                if c <= 23:
-                    set_pixel(up_w1, min(r + 1, 46), c, v)
-                else:
-                    set_pixel(up_w1, max(r - 1, 0), c, v)
-    for r in (32, 33):
-        for c_val in [(14, SAs), (21, SAo)]:
-            set_pixel(up_w1, min(r + 1, 46), c_val[0], c_val[1])
-        for c_val in [(27, SAo), (34, SAs)]:
-            set_pixel(up_w1, max(r - 1, 0), c_val[0], c_val[1])
-
-    up_w2 = empty_frame()
-    for r in range(30, 41):
-        for c in range(W):
-            v = up_idle[r][c]
-            if v != T:
-                if c <= 23:
-                    set_pixel(up_w2, max(r - 1, 0), c, v)
-                else:
-                    set_pixel(up_w2, min(r + 1, 46), c, v)
-    for r in (32, 33):
-        for c_val in [(14, SAs), (21, SAo)]:
-            set_pixel(up_w2, max(r - 1, 0), c_val[0], c_val[1])
-        for c_val in [(27, SAo), (34, SAs)]:
-            set_pixel(up_w2, min(r + 1, 46), c_val[0], c_val[1])
+    up_w1 = shift_split(up_idle, 30, 40, 24, 1, -1)
+    up_w2 = shift_split(up_idle, 30, 40, 24, -1, 1)
 
     directions = {
         "down": {"idle": down_idle, "walk_1": down_w1, "walk_2": down_w2},
@@ -489,152 +509,78 @@ def generate_greaves():
 # ===================================================================
 # TEMPLATE 3 — Brown Leather Boots (z:3)
 # ===================================================================
+def draw_boot(f, lc, rc, tongue):
+    """Draw one boot over rows 41-44, cols lc..rc.
+
+    Rows 41-43 are outline / base / outline column stripes, row 44 is the
+    sole. With `tongue`, a 3px highlight sits two cols in on row 41.
+    """
+    f[41:44, lc:rc + 1] = BLb
+    f[41:44, [lc, rc]] = BLo        # side outline
+    if tongue:
+        f[41, lc + 2:lc + 5] = BLh  # tongue highlight
+    f[44, lc:rc + 1] = BLs          # sole
+
+
+@lru_cache(maxsize=None)
+def _boots_down_idle():
+    """Idle boots, facing down. Cached and read-only; copy before editing."""
+    f = empty_frame()
+    # Left boot: cols 14-20, rows 41-44
+    draw_boot(f, 14, 20, tongue=True)
+    # Right boot: cols 28-34, rows 41-44
+    draw_boot(f, 28, 34, tongue=True)
+    f.flags.writeable = False
+    return f
+
+
+@lru_cache(maxsize=None)
+def _boots_left_idle():
+    """Idle boots, facing left. Cached and read-only; copy before editing."""
+    f = empty_frame()
+    # Single boot from side: cols 17-24 (~8px wide), rows 41-44
+    draw_boot(f, 17, 24, tongue=True)
+    f.flags.writeable = False
+    return f
+
+
+@lru_cache(maxsize=None)
+def _boots_up_idle():
+    """Idle boots, facing up. Cached and read-only; copy before editing."""
+    f = empty_frame()
+    # Same positions as down, shading reversed
+    # Left boot: cols 14-20
+    draw_boot(f, 14, 20, tongue=False)
+    # Right boot: cols 28-34
+    draw_boot(f, 28, 34, tongue=False)
+    f.flags.writeable = False
+    return f
+
+
 def generate_boots():
     """
     Wider, chunkier boots at new foot positions.
     DOWN: rows 41-44, left boot cols ~14-20 (~7px), right boot cols ~28-34 (~7px).
     LEFT: single boot, ~8px wide, rows 41-44.
     """
-
-    def _boots_down_idle():
-        f = empty_frame()
-        # Left boot: cols 14-20, rows 41-44
-        for r in range(41, 45):
-            for c in range(14, 21):
-                if r == 44:
-                    set_pixel(f, r, c, BLs)       # sole
-                elif r == 41 and c in (16, 17, 18):
-                    set_pixel(f, r, c, BLh)       # tongue highlight
-                elif c == 14 or c == 20:
-                    set_pixel(f, r, c, BLo)       # side outline
-                else:
-                    set_pixel(f, r, c, BLb)       # base
-        # Right boot: cols 28-34, rows 41-44
-        for r in range(41, 45):
-            for c in range(28, 35):
-                if r == 44:
-                    set_pixel(f, r, c, BLs)
-                elif r == 41 and c in (30, 31, 32):
-                    set_pixel(f, r, c, BLh)
-                elif c == 28 or c == 34:
-                    set_pixel(f, r, c, BLo)
-                else:
-                    set_pixel(f, r, c, BLb)
-        return f
-
     down_idle = _boots_down_idle()
 
     # walk_1: left foot forward (shift down 1), right foot back (shift up 1)
-    down_w1 = empty_frame()
-    for r in range(41, 45):
-        for c in range(W):
-            v = down_idle[r][c]
-            if v != T:
-                if c <= 23:  # left boot
-                    set_pixel(down_w1, min(r + 1, 47), c, v)
-                else:        # right boot
-                    set_pixel(down_w1, max(r - 1, 0), c, v)
-
+    down_w1 = shift_split(down_idle, 41, 44, 24, 1, -1)
     # walk_2: opposite
-    down_w2 = empty_frame()
-    for r in range(41, 45):
-        for c in range(W):
-            v = down_idle[r][c]
-            if v != T:
-                if c <= 23:
-                    set_pixel(down_w2, max(r - 1, 0), c, v)
-                else:
-                    set_pixel(down_w2, min(r + 1, 47), c, v)
+    down_w2 = shift_split(down_idle, 41, 44, 24, -1, 1)
 
     # --- LEFT ---
-    def _boots_left_idle():
-        f = empty_frame()
-        # Single boot from side: cols 17-24 (~8px wide), rows 41-44
-        for r in range(41, 45):
-            for c in range(17, 25):
-                if r == 44:
-                    set_pixel(f, r, c, BLs)       # sole
-                elif r == 41 and c in (19, 20, 21):
-                    set_pixel(f, r, c, BLh)       # tongue
-                elif c == 17 or c == 24:
-                    set_pixel(f, r, c, BLo)       # outline
-                else:
-                    set_pixel(f, r, c, BLb)
-        return f
-
     left_idle = _boots_left_idle()
 
-    # walk_1: front foot forward/down, back foot up
-    left_w1 = empty_frame()
-    for r in range(41, 45):
-        for c in range(17, 25):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w1, min(r + 1, 47), c - 1, v)
-    # Back foot
-    for r in range(41, 45):
-        for c in range(17, 25):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w1, max(r - 1, 0), c + 1, v)
-
-    left_w2 = empty_frame()
-    for r in range(41, 45):
-        for c in range(17, 25):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w2, min(r + 1, 47), c + 1, v)
-    for r in range(41, 45):
-        for c in range(17, 25):
-            v = left_idle[r][c]
-            if v != T:
-                set_pixel(left_w2, max(r - 1, 0), c - 1, v)
+    # walk_1: front foot forward/down, back foot up; walk_2 the opposite
+    left_w1, left_w2 = stride_walk(left_idle, 41, 44, 17, 24, 1)
 
     # --- UP ---
-    def _boots_up_idle():
-        f = empty_frame()
-        # Same positions as down, shading reversed
-        # Left boot: cols 14-20
-        for r in range(41, 45):
-            for c in range(14, 21):
-                if r == 44:
-                    set_pixel(f, r, c, BLs)
-                elif c == 14 or c == 20:
-                    set_pixel(f, r, c, BLo)
-                else:
-                    set_pixel(f, r, c, BLb)
-        # Right boot: cols 28-34
-        for r in range(41, 45):
-            for c in range(28, 35):
-                if r == 44:
-                    set_pixel(f, r, c, BLs)
-                elif c == 28 or c == 34:
-                    set_pixel(f, r, c, BLo)
-                else:
-                    set_pixel(f, r, c, BLb)
-        return f
-
     up_idle = _boots_up_idle()
 
-    up_w1 = empty_frame()
-    for r in range(41, 45):
-        for c in range(W):
-            v = up_idle[r][c]
-            if v != T:
-                if c <= 23:
-                    set_pixel(up_w1, min(r + 1, 47), c, v)
-                else:
-                    set_pixel(up_w1, max(r - 1, 0), c, v)
-
-    up_w2 = empty_frame()
-    for r in range(41, 45):
-        for c in range(W):
-            v = up_idle[r][c]
-            if v != T:
-                if c <= 23:
-                    set_pixel(up_w2, max(r - 1, 0), c, v)
-                else:
-                    set_pixel(up_w2, min(r + 1, 47), c, v)
+    up_w1 = shift_split(up_idle, 41, 44, 24, 1, -1)
+    up_w2 = shift_split(up_idle, 41, 44, 24, -1, 1)
 
     directions = {
         "down": {"idle": down_idle, "walk_1": down_w1, "walk_2": down_w2},
@@ -647,6 +593,38 @@ def generate_boots():
 # ===================================================================
 # TEMPLATE 4 — Longsword (z:9, up:-1)
 # ===================================================================
+# Blade tip (DOWN), tapering to a point at row 20
+SWORD_DOWN_TIP = pixel_table(
+    (20, 8, SWo),
+    (21, 7, SWo), (21, 8, SWe), (21, 9, SWo),
+)
+# Pommel (DOWN): rows 32-33, cols 7-9 (3px with red gem)
+SWORD_DOWN_POMMEL = pixel_table(
+    (32, 7, SWg), (32, 8, SWp), (32, 9, SWg),   # red gem center
+    (33, 7, SWo), (33, 8, SWg), (33, 9, SWo),
+)
+# LEFT: sword behind body — partial blade visible sticking up behind, cols 27-29
+SWORD_LEFT = pixel_table(
+    # Blade tip peeking above shoulder
+    (18, 28, SWo),
+    (19, 28, SWe),
+    (20, 27, SWo), (20, 28, SWbl), (20, 29, SWo),
+    (21, 27, SWo), (21, 28, SWbl), (21, 29, SWsh),
+    (22, 27, SWe), (22, 28, SWbl), (22, 29, SWsh),
+    (23, 27, SWe), (23, 28, SWbl),
+    (24, 27, SWsh), (24, 28, SWbl),
+    # Guard hint at hip
+    (25, 26, SWg), (25, 27, SWg), (25, 28, SWg),
+    # Pommel
+    (26, 27, SWp), (26, 28, SWg),
+)
+# UP: mostly hidden — just pommel/grip hint at hip level
+SWORD_UP = pixel_table(
+    (28, 8, SWp), (28, 9, SWg),
+    (29, 8, SWg), (29, 9, SWo),
+)
+
+
 def generate_longsword():
     """
     Sword visible on LEFT side of sprite (viewer's left, character's right).
@@ -659,39 +637,19 @@ def generate_longsword():
     down_idle = empty_frame()
     # Blade: rows 20-27, cols 7-9 (3px wide, tapers to point at top)
     # Tip
-    set_pixel(down_idle, 20, 8, SWo)
-    set_pixel(down_idle, 21, 7, SWo)
-    set_pixel(down_idle, 21, 8, SWe)
-    set_pixel(down_idle, 21, 9, SWo)
-    # Blade body
-    for r in range(22, 28):
-        set_pixel(down_idle, r, 7, SWe)     # bright edge
-        set_pixel(down_idle, r, 8, SWbl)    # blade center
-        set_pixel(down_idle, r, 9, SWsh)    # shadow edge
-    # Blade outline left/right
-    for r in range(22, 28):
-        set_pixel(down_idle, r, 6, SWo)
-        set_pixel(down_idle, r, 10, SWo)
+    stamp(down_idle, SWORD_DOWN_TIP)
+    # Blade body: outline, bright edge, blade center, shadow edge, outline
+    down_idle[22:28, 6:11] = (SWo, SWe, SWbl, SWsh, SWo)
 
     # Guard: row 28, cols 5-11 (7px wide cross-guard)
-    for c in range(5, 12):
-        set_pixel(down_idle, 28, c, SWg)
-    set_pixel(down_idle, 28, 5, SWo)
-    set_pixel(down_idle, 28, 11, SWo)
+    down_idle[28, 5:12] = SWg
+    down_idle[28, [5, 11]] = SWo
 
     # Grip: rows 29-31, col 8
-    for r in range(29, 32):
-        set_pixel(down_idle, r, 8, SWgr)
-        set_pixel(down_idle, r, 7, SWo)
-        set_pixel(down_idle, r, 9, SWo)
+    down_idle[29:32, 7:10] = (SWo, SWgr, SWo)
 
     # Pommel: rows 32-33, cols 7-9 (3px with red gem)
-    set_pixel(down_idle, 32, 7, SWg)
-    set_pixel(down_idle, 32, 8, SWp)   # red gem
-    set_pixel(down_idle, 32, 9, SWg)
-    set_pixel(down_idle, 33, 7, SWo)
-    set_pixel(down_idle, 33, 8, SWg)
-    set_pixel(down_idle, 33, 9, SWo)
+    stamp(down_idle, SWORD_DOWN_POMMEL)
 
     # walk: slight sway
     down_w1 = shift_frame(down_idle, 0, 1)
@@ -699,30 +657,8 @@ def generate_longsword():
 
     # --- LEFT ---
     left_idle = empty_frame()
-    # Sword behind body — partial blade visible sticking up behind, cols 27-29
-    # Blade tip peeking above shoulder
-    set_pixel(left_idle, 18, 28, SWo)
-    set_pixel(left_idle, 19, 28, SWe)
-    set_pixel(left_idle, 20, 27, SWo)
-    set_pixel(left_idle, 20, 28, SWbl)
-    set_pixel(left_idle, 20, 29, SWo)
-    set_pixel(left_idle, 21, 27, SWo)
-    set_pixel(left_idle, 21, 28, SWbl)
-    set_pixel(left_idle, 21, 29, SWsh)
-    set_pixel(left_idle, 22, 27, SWe)
-    set_pixel(left_idle, 22, 28, SWbl)
-    set_pixel(left_idle, 22, 29, SWsh)
-    set_pixel(left_idle, 23, 27, SWe)
-    set_pixel(left_idle, 23, 28, SWbl)
-    set_pixel(left_idle, 24, 27, SWsh)
-    set_pixel(left_idle, 24, 28, SWbl)
-    # Guard hint at hip
-    set_pixel(left_idle, 25, 26, SWg)
-    set_pixel(left_idle, 25, 27, SWg)
-    set_pixel(left_idle, 25, 28, SWg)
-    # Pommel
-    set_pixel(left_idle, 26, 27, SWp)
-    set_pixel(left_idle, 26, 28, SWg)
+    # Sword behind body — blade tip above the shoulder, guard and pommel at hip
+    stamp(left_idle, SWORD_LEFT)
 
     left_w1 = shift_frame(left_idle, 0, 1)
     left_w2 = shift_frame(left_idle, 0, -1)
@@ -730,10 +666,7 @@ def generate_longsword():
     # --- UP ---
     up_idle = empty_frame()
     # Mostly hidden — just pommel/grip hint at hip level
-    set_pixel(up_idle, 28, 8, SWp)
-    set_pixel(up_idle, 28, 9, SWg)
-    set_pixel(up_idle, 29, 8, SWg)
-    set_pixel(up_idle, 29, 9, SWo)
+    stamp(up_idle, SWORD_UP)
 
     up_w1 = shift_frame(up_idle, 0, 1)
     up_w2 = shift_frame(up_idle, 0, -1)
@@ -749,6 +682,23 @@ def generate_longsword():
 # ===================================================================
 # TEMPLATE 5 — Kite Shield (Rhaud) (z:9, overrides: left:10 right:-1 up:8)
 # ===================================================================
+def fill_shield(frame, rows, rim_row=None):
+    """Fill a shield outline given as {row: (c1, c2)}, one slice per row.
+
+    Each row gets the gold border on its end cols, the steel rim just
+    inside them and the navy field between. The first and last rows are
+    all border, and `rim_row` (if given) is all rim inside its border.
+    """
+    top, bot = min(rows), max(rows)
+    for r, (c1, c2) in rows.items():
+        if r in (top, bot):
+            frame[r, c1:c2 + 1] = SHb
+            continue
+        frame[r, c1:c2 + 1] = SHr if r == rim_row else SHf
+        frame[r, c1 + 1] = frame[r, c2 - 1] = SHr
+        frame[r, c1] = frame[r, c2] = SHb
+
+
 def generate_shield():
     """
     BIGGEST FIX: shield much more prominent.
@@ -783,17 +733,9 @@ def generate_shield():
         34: (10, 11),
     }
 
-    for r, (c1, c2) in kite_down.items():
-        for c in range(c1, c2 + 1):
-            # Gold border on edges and top/bottom rows
-            if c == c1 or c == c2 or r == 16 or r == 34:
-                set_pixel(down_idle, r, c, SHb)
-            # Steel rim just inside border
-            elif c == c1 + 1 or c == c2 - 1 or r == 17:
-                set_pixel(down_idle, r, c, SHr)
-            # Navy field interior
-            else:
-                set_pixel(down_idle, r, c, SHf)
+    # Gold border on edges and top/bottom rows, steel rim just inside
+    # (all of row 17), navy field interior
+    fill_shield(down_idle, kite_down, rim_row=17)
 
     # Lion crest in center of shield: rows 21-27, cols 8-13
     # Simplified rearing lion silhouette in gold
@@ -813,8 +755,7 @@ def generate_shield():
         # Row 27: legs/base
         (27, 9, GTb), (27, 10, GTb), (27, 11, GTb), (27, 12, GTb),
     ]
-    for r, c, v in crest_down:
-        set_pixel(down_idle, r, c, v)
+    stamp(down_idle, pixel_table(*crest_down))
 
     # Walk: slight vertical bob
     down_w1 = shift_frame(down_idle, 1, 0)
@@ -847,14 +788,7 @@ def generate_shield():
         35: (20, 22),
     }
 
-    for r, (c1, c2) in kite_left.items():
-        for c in range(c1, c2 + 1):
-            if c == c1 or c == c2 or r == 15 or r == 35:
-                set_pixel(left_idle, r, c, SHb)    # gold border
-            elif c == c1 + 1 or c == c2 - 1 or r == 16:
-                set_pixel(left_idle, r, c, SHr)    # steel rim
-            else:
-                set_pixel(left_idle, r, c, SHf)    # navy field
+    fill_shield(left_idle, kite_left, rim_row=16)
 
     # Full lion crest centered: rows 20-28, cols 17-25
     crest_left = [
@@ -877,8 +811,7 @@ def generate_shield():
         # Row 28: base/paws
         (28, 19, GTb), (28, 20, GTb), (28, 21, GTb), (28, 22, GTb), (28, 23, GTb),
     ]
-    for r, c, v in crest_left:
-        set_pixel(left_idle, r, c, v)
+    stamp(left_idle, pixel_table(*crest_left))
 
     left_w1 = shift_frame(left_idle, 1, 0)
     left_w2 = shift_frame(left_idle, -1, 0)
@@ -905,29 +838,13 @@ def generate_shield():
         31: (21, 27),
         32: (22, 26),
     }
-    for r, (c1, c2) in oval_rows.items():
-        for c in range(c1, c2 + 1):
-            if c == c1 or c == c2:
-                set_pixel(up_idle, r, c, SHb)    # border
-            elif c == c1 + 1 or c == c2 - 1:
-                set_pixel(up_idle, r, c, SHr)    # rim
-            else:
-                set_pixel(up_idle, r, c, SHf)    # field
-
-    # Top/bottom border fill
-    for r in (16, 32):
-        if r in oval_rows:
-            c1, c2 = oval_rows[r]
-            for c in range(c1, c2 + 1):
-                set_pixel(up_idle, r, c, SHb)
+    # Border, rim and field, with solid border top/bottom rows
+    fill_shield(up_idle, oval_rows)
 
     # Leather straps: two vertical lines
-    for r in range(18, 29):
-        set_pixel(up_idle, r, 21, BLb)
-        set_pixel(up_idle, r, 27, BLb)
+    up_idle[18:29, [21, 27]] = BLb
     # Horizontal strap crossing
-    for c in range(21, 28):
-        set_pixel(up_idle, 23, c, BLb)
+    up_idle[23, 21:28] = BLb
 
     up_w1 = shift_frame(up_idle, 1, 0)
     up_w2 = shift_frame(up_idle, -1, 0)
@@ -957,73 +874,31 @@ def generate_cape():
     # --- DOWN (z:-1, behind body — very minimal edge on right side) ---
     down_idle = empty_frame()
     # Just 1-2px edge peeking out on the right side behind the body
-    for r in range(15, 39):
-        set_pixel(down_idle, r, 38, CPo)    # outline edge
-        if r > 22:
-            set_pixel(down_idle, r, 39, CPs)    # shadow
-        if r > 30:
-            set_pixel(down_idle, r, 40, CPs)    # wider near bottom
-
-    down_w1 = copy_frame(down_idle)
-    down_w2 = copy_frame(down_idle)
+    down_idle[15:39, 38] = CPo    # outline edge
+    down_idle[23:39, 39] = CPs    # shadow
+    down_idle[31:39, 40] = CPs    # wider near bottom
 
     # --- LEFT (z:-1, behind body — medium drape) ---
     left_idle = empty_frame()
-    # Cape drapes behind body, cols 28-36, rows 14-40
-    for r in range(14, 41):
-        # Width increases gradually as we go down
-        if r < 18:
-            c_start, c_end = 30, 34
-        elif r < 24:
-            c_start, c_end = 29, 35
-        elif r < 32:
-            c_start, c_end = 28, 36
-        else:
-            c_start, c_end = 28, 36
-
-        for c in range(c_start, c_end + 1):
-            if c == c_start:
-                set_pixel(left_idle, r, c, CPo)     # outline on leading edge
-            elif c == c_end:
-                set_pixel(left_idle, r, c, CPs)     # shadow on trailing edge
-            else:
-                # Fold lines for texture
-                if (c - c_start) % 3 == 0:
-                    set_pixel(left_idle, r, c, CPs)
-                else:
-                    set_pixel(left_idle, r, c, CPp)
+    # Cape drapes behind body, cols 28-36, rows 14-40; width increases
+    # gradually as we go down
+    for top, bot, c_start, c_end in ((14, 17, 30, 34), (18, 23, 29, 35), (24, 40, 28, 36)):
+        band = left_idle[top:bot + 1]
+        band[:, c_start + 1:c_end] = CPp
+        band[:, c_start + 3:c_end:3] = CPs    # fold lines for texture
+        band[:, c_start] = CPo                # outline on leading edge
+        band[:, c_end] = CPs                  # shadow on trailing edge
 
     # Highlight on shoulder area
-    for r in range(14, 19):
-        set_pixel(left_idle, r, 31, CPh)
+    left_idle[14:19, 31] = CPh
 
-    # Scalloped bottom edge
-    for c in range(28, 37):
-        if c % 2 == 0:
-            set_pixel(left_idle, 40, c, CPo)
-        else:
-            set_pixel(left_idle, 39, c, CPo)  # alternating scallop
+    # Scalloped bottom edge: even cols end at row 40, odd cols at row 39
+    left_idle[40, 28:37:2] = CPo
+    left_idle[39, 29:37:2] = CPo
 
-    left_w1 = copy_frame(left_idle)
     # Slight sway on bottom portion
-    for r in range(35, 41):
-        old_row = left_idle[r][:]
-        left_w1[r] = [T] * W
-        for c in range(W):
-            if old_row[c] != T:
-                nc = c + 1
-                if 0 <= nc < W:
-                    left_w1[r][nc] = old_row[c]
-
-    left_w2 = copy_frame(left_idle)
-    for r in range(35, 41):
-        old_row = left_idle[r][:]
-        left_w2[r] = [T] * W
-        for c in range(W):
-            if old_row[c] != T:
-                nc = c - 1
-                if 0 <= nc < W:
-                    left_w2[r][nc] = old_row[c]
+    left_w1 = sway_rows(left_idle, 35, 40, 1)
+    left_w2 = sway_rows(left_idle, 35, 40, -1)
 
     # --- UP (z:10, IN FRONT — cape over back, BUT legs/boots visible below!) ---
     up_idle = empty_frame()
@@ -1059,33 +934,17 @@ def generate_cape():
     }
 
     for r, (c1, c2) in cape_up_rows.items():
-        for c in range(c1, c2 + 1):
-            if c == c1 or c == c2:
-                set_pixel(up_idle, r, c, CPo)       # outline
-            elif c == c1 + 1:
-                set_pixel(up_idle, r, c, CPs)       # shadow left edge
-            elif c == c2 - 1:
-                set_pixel(up_idle, r, c, CPs)       # shadow right edge
-            else:
-                # Vertical fold lines every 4 cols for texture
-                if (c - c1) % 4 == 0:
-                    set_pixel(up_idle, r, c, CPs)
-                else:
-                    set_pixel(up_idle, r, c, CPp)
+        up_idle[r, c1 + 1:c2] = CPp
+        up_idle[r, c1 + 4:c2 - 1:4] = CPs                  # vertical fold lines every 4 cols
+        up_idle[r, c1 + 1] = up_idle[r, c2 - 1] = CPs      # shadow left/right edge
+        up_idle[r, c1] = up_idle[r, c2] = CPo              # outline
 
     # Scalloped/rounded bottom edge at row 38 (not a flat rectangle!)
-    # Create gentle curves: some cols end at 37, some at 38
-    scallop_bottom = []
+    # Create gentle curves: every 3rd column of the bottom rows, the cape
+    # extends 1 row lower (scallop)
     for r_key in (36, 37):
-        if r_key in cape_up_rows:
-            c1, c2 = cape_up_rows[r_key]
-            for c in range(c1, c2 + 1):
-                # Every 3rd column, the cape extends 1 row lower (scallop)
-                if (c - c1) % 3 == 1:
-                    scallop_bottom.append((38, c))
-
-    for r, c in scallop_bottom:
-        set_pixel(up_idle, r, c, CPo)
+        c1, c2 = cape_up_rows[r_key]
+        up_idle[38, c1 + 1:c2 + 1:3] = CPo
 
     # Highlight on left shoulder area
     for r in range(14, 20):
@@ -1107,28 +966,11 @@ def generate_cape():
     set_pixel(up_idle, 15, 36, SAh)
 
     # Walk: bottom sways 1px right (walk_1) / left (walk_2) — subtle
-    up_w1 = copy_frame(up_idle)
-    for r in range(33, 39):
-        old_row = up_idle[r][:]
-        up_w1[r] = [T] * W
-        for c in range(W):
-            if old_row[c] != T:
-                nc = c + 1
-                if 0 <= nc < W:
-                    up_w1[r][nc] = old_row[c]
-
-    up_w2 = copy_frame(up_idle)
-    for r in range(33, 39):
-        old_row = up_idle[r][:]
-        up_w2[r] = [T] * W
-        for c in range(W):
-            if old_row[c] != T:
-                nc = c - 1
-                if 0 <= nc < W:
-                    up_w2[r][nc] = old_row[c]
+    up_w1 = sway_rows(up_idle, 33, 38, 1)
+    up_w2 = sway_rows(up_idle, 33, 38, -1)
 
     directions = {
-        "down": {"idle": down_idle, "walk_1": down_w1, "walk_2": down_w2},
+        "down": static_walk(down_idle),
         "left": {"idle": left_idle, "walk_1": left_w1, "walk_2": left_w2},
         "up":   {"idle": up_idle,   "walk_1": up_w1,   "walk_2": up_w2},
     }
@@ -1151,6 +993,7 @@ def main():
     ]
 
     all_errors = []
+    decoded = {}  # frame bytes -> palette-key grid, shared across templates
     print("=" * 60)
     print("Equipment Group 2 — Template Generator (v2 chibi body)")
     print("=" * 60)
@@ -1166,13 +1009,10 @@ def main():
                 errors.extend(validate_frame(frame, tid, d_name, a_name))
 
         # Count non-transparent pixels per direction
-        pixel_counts = {}
-        for d_name, anims in tmpl["directions"].items():
-            total = 0
-            for a_name, frame in anims.items():
-                for row_data in frame:
-                    total += sum(1 for v in row_data if v != T)
-            pixel_counts[d_name] = total
+        pixel_counts = {
+            d_name: sum(int(np.count_nonzero(frame)) for frame in anims.values())
+            for d_name, anims in tmpl["directions"].items()
+        }
 
         if errors:
             all_errors.extend(errors)
@@ -1184,8 +1024,7 @@ def main():
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         # Write JSON
-        with open(path, "w") as f:
-            json.dump(tmpl, f, indent=2)
+        write_json(template_json(tmpl, decoded), path)
 
         file_size = os.path.getsize(path)
         print(f"\n  [{status}] {tid}")